@@ -0,0 +1,298 @@
+from fastapi import Request
+from fastapi.responses import Response
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Optional, Tuple, Union
+import fcntl
+import hashlib
+import mmap
+import os
+import threading
+
+
+Buffer = Union[bytes, memoryview]
+
+
+class Artifact:
+    """Immutable snapshot of a binary payload with its HTTP validators
+
+    `content` is either bytes or a read-only memoryview over a shared mapping.
+    """
+
+    def __init__(self, content: Buffer, mtime: float, media_type: str = "application/pdf"):
+        self.content = content
+        self.mtime = mtime
+        self.media_type = media_type
+        self.size = len(content)
+        self.etag = '"' + hashlib.sha256(content).hexdigest()[:32] + '"'
+        self.last_modified = formatdate(int(mtime), usegmt=True)
+
+
+def map_file(path: Path) -> Tuple[memoryview, os.stat_result]:
+    """Read-only shared mapping of `path` with the stat of the mapped inode
+
+    Every process mapping the same file shares its page-cache pages, so N
+    workers hold about one copy. A mapping stays valid after the path is
+    replaced with os.replace; files must never be rewritten in place.
+    """
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        if st.st_size == 0:
+            return memoryview(b""), st
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)), st
+
+
+def write_atomic(path: Path, content: Buffer, mtime: Optional[float] = None):
+    """Write to a temporary sibling and rename it over `path`"""
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    if mtime is not None:
+        os.utime(tmp_path, (mtime, mtime))
+    os.replace(tmp_path, path)
+
+
+class FileArtifact:
+    """Load a file once and reload it only when it is replaced or changes
+
+    With `shared=True` the file is memory-mapped instead of read into private
+    bytes. Only use that for files published with write_atomic: rewriting a
+    mapped file in place (cp, an editor, a deploy copying over it) kills every
+    process reading the old mapping with SIGBUS.
+    """
+
+    def __init__(self, path: Path, media_type: str = "application/pdf", shared: bool = False):
+        self.path = Path(path)
+        self.media_type = media_type
+        self.shared = shared
+        self._artifact: Optional[Artifact] = None
+        self._stat_key: Optional[Tuple[int, int, int]] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Artifact:
+        """Return the current artifact, raising FileNotFoundError if missing"""
+        st = os.stat(self.path)
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if self._artifact is not None and key == self._stat_key:
+            return self._artifact
+        with self._lock:
+            if self._artifact is None or key != self._stat_key:
+                content, loaded = self._load()
+                self._artifact = Artifact(content, loaded.st_mtime, self.media_type)
+                self._stat_key = (loaded.st_ino, loaded.st_mtime_ns, loaded.st_size)
+        return self._artifact
+
+    def _load(self) -> Tuple[Buffer, os.stat_result]:
+        if self.shared:
+            # Responses still holding the previous view keep its mapping alive
+            return map_file(self.path)
+        with open(self.path, "rb") as f:
+            return f.read(), os.fstat(f.fileno())
+
+
+class ArtifactStore:
+    """Directory of memory-mapped artifacts shared by every worker process
+
+    One process renders and writes an artifact; the others find it on disk and
+    map the same pages. Replacement is atomic (write then rename), and an
+    exclusive file lock lets a single process produce each artifact.
+    """
+
+    def __init__(self, directory: Path, media_type: str = "application/pdf"):
+        self.directory = Path(directory)
+        self.media_type = media_type
+        self._files = {}
+
+    def _file(self, name: str) -> FileArtifact:
+        artifact = self._files.get(name)
+        if artifact is None:
+            artifact = self._files[name] = FileArtifact(self.directory / name, self.media_type, shared=True)
+        return artifact
+
+    def get(self, name: str) -> Optional[Artifact]:
+        try:
+            return self._file(name).get()
+        except FileNotFoundError:
+            return None
+
+    def put(self, name: str, content: Buffer, replaces: str = "", mtime: Optional[float] = None) -> Artifact:
+        """Publish `content` under `name`, dropping older files matching `replaces*`"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.directory / name, content, mtime)
+        if replaces:
+            for old in self.directory.glob(replaces + "*"):
+                if old.name != name and not old.name.endswith(".lock"):
+                    old.unlink(missing_ok=True)
+                    self._files.pop(old.name, None)
+        return self._file(name).get()
+
+    def acquire(self, name: str) -> int:
+        """Block until this process holds the lock for producing `name`"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.directory / (name + ".lock"), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        except BaseException:
+            os.close(fd)
+            raise
+        return fd
+
+    @staticmethod
+    def release(fd: int):
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+class MirroredFile:
+    """Serve a hand-managed file from a mapped copy published in an ArtifactStore
+
+    The source may be rewritten in place (cp, an editor, a deploy), so it is
+    never mapped itself: whenever its stat changes, its bytes are copied into
+    the store under a content-hashed name with write-then-rename, and the
+    copy is what every worker maps.
+    """
+
+    def __init__(self, path: Path, store: ArtifactStore):
+        self.path = Path(path)
+        self.store = store
+        self._artifact: Optional[Artifact] = None
+        self._stat_key: Optional[Tuple[int, int, int]] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Artifact:
+        """Return the current artifact, raising FileNotFoundError if the source is missing"""
+        st = os.stat(self.path)
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if self._artifact is not None and key == self._stat_key:
+            return self._artifact
+        with self._lock:
+            if self._artifact is None or key != self._stat_key:
+                with open(self.path, "rb") as f:
+                    content = f.read()
+                    loaded = os.fstat(f.fileno())
+                prefix = f"{self.path.stem}-"
+                name = f"{prefix}{hashlib.sha256(content).hexdigest()[:16]}{self.path.suffix}"
+                # Workers mirroring the same content reuse (and map) the first copy
+                artifact = self.store.get(name)
+                if artifact is None:
+                    fd = self.store.acquire(name)
+                    try:
+                        artifact = self.store.get(name)
+                        if artifact is None:
+                            artifact = self.store.put(name, content, replaces=prefix, mtime=loaded.st_mtime)
+                    finally:
+                        self.store.release(fd)
+                self._artifact = artifact
+                self._stat_key = (loaded.st_ino, loaded.st_mtime_ns, loaded.st_size)
+        return self._artifact
+
+
+def _not_modified(request: Request, artifact: Artifact) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since against the artifact"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or artifact.etag in tags or f"W/{artifact.etag}" in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(artifact.mtime) <= since
+    return False
+
+
+class _RangeNotSatisfiable(Exception):
+    pass
+
+
+def _is_digits(value: str) -> bool:
+    return value.isascii() and value.isdigit()
+
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single `bytes=` range into inclusive (start, end) offsets
+
+    Returns None when the header is to be ignored (other unit, several ranges,
+    malformed spec) and raises _RangeNotSatisfiable when it is well-formed but
+    selects no byte of the artifact.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    start_s, sep, end_s = spec.strip().partition("-")
+    if not sep or not (start_s or end_s) or not all(_is_digits(s) for s in (start_s, end_s) if s):
+        return None
+    if start_s == "":
+        length = int(end_s)
+        if length == 0 or size == 0:
+            raise _RangeNotSatisfiable
+        return max(size - length, 0), size - 1
+    start = int(start_s)
+    end = int(end_s) if end_s else size - 1
+    if end_s and end < start:
+        return None
+    if start >= size:
+        raise _RangeNotSatisfiable
+    return start, min(end, size - 1)
+
+
+class _BufferResponse(Response):
+    """Response whose body may be a memoryview, sent without copying"""
+
+    def render(self, content) -> Buffer:
+        return b"" if content is None else content
+
+
+def artifact_response(
+    request: Request,
+    artifact: Artifact,
+    filename: str,
+    cache_control: str = "public, max-age=0, must-revalidate",
+) -> Response:
+    """Build a 200/206/304/416 response for an artifact honouring validators and Range"""
+    headers = {
+        "ETag": artifact.etag,
+        "Last-Modified": artifact.last_modified,
+        "Cache-Control": cache_control,
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": f"attachment; filename={filename}",
+    }
+
+    if _not_modified(request, artifact):
+        headers.pop("Content-Disposition")
+        return Response(status_code=304, headers=headers)
+
+    body = artifact.content
+    status_code = 200
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or if_range == artifact.etag):
+        try:
+            byte_range = _parse_range(range_header, artifact.size)
+        except _RangeNotSatisfiable:
+            return Response(
+                status_code=416,
+                headers={"Content-Range": f"bytes */{artifact.size}", "ETag": artifact.etag},
+            )
+        if byte_range is not None:
+            start, end = byte_range
+            body = memoryview(artifact.content)[start:end + 1]
+            headers["Content-Range"] = f"bytes {start}-{end}/{artifact.size}"
+            status_code = 206
+
+    if request.method == "HEAD":
+        headers["Content-Length"] = str(len(body))
+        return Response(status_code=status_code, headers=headers, media_type=artifact.media_type)
+
+    return _BufferResponse(
+        content=body,
+        status_code=status_code,
+        headers=headers,
+        media_type=artifact.media_type,
+    )
@@ -0,0 +1,179 @@
+from typing import Iterable, Optional, Tuple
+import gzip
+import zlib
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+# Qualities used for payloads compressed once and reused
+STATIC_GZIP_LEVEL = 9
+STATIC_BROTLI_QUALITY = 11
+
+# Already-compressed or incremental media types are passed through untouched
+SKIP_CONTENT_TYPES = (
+    "application/pdf",
+    "application/gzip",
+    "application/zip",
+    "application/vnd.apache.parquet",
+    "image/",
+    "video/",
+    "audio/",
+    "text/event-stream",
+)
+
+
+def supported_encodings() -> Tuple[str, ...]:
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """Best supported coding allowed by Accept-Encoding (brotli preferred on ties)"""
+    if not accept_encoding:
+        return None
+    weights = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[coding.strip().lower()] = q
+    best, best_q = None, 0.0
+    for coding in supported_encodings():
+        q = weights.get(coding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def compress(body: bytes, encoding: str, static: bool = False) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=STATIC_BROTLI_QUALITY if static else BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=STATIC_GZIP_LEVEL if static else GZIP_LEVEL, mtime=0)
+
+
+class _StreamCompressor:
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+            self._flush = self._compressor.finish
+            self._compress = self._compressor.process
+        else:
+            self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+            self._flush = self._compressor.flush
+            self._compress = self._compressor.compress
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compress(data)
+
+    def finish(self) -> bytes:
+        return self._flush()
+
+
+def _skip_content_type(headers: Iterable[Tuple[bytes, bytes]]) -> bool:
+    for name, value in headers:
+        if name == b"content-type":
+            return value.decode("latin-1").lower().startswith(SKIP_CONTENT_TYPES)
+    return False
+
+
+def _add_vary(headers: Iterable[Tuple[bytes, bytes]], field: bytes) -> list:
+    """Merge the Vary headers into one, appending `field` unless already listed"""
+    vary = [value for name, value in headers if name == b"vary"]
+    tokens = {token.strip().lower() for value in vary for token in value.split(b",")}
+    if field.lower() not in tokens and b"*" not in tokens:
+        vary.append(field)
+    base = [(name, value) for name, value in headers if name != b"vary"]
+    base.append((b"vary", b", ".join(vary)))
+    return base
+
+
+class CompressionMiddleware:
+    """Pure ASGI gzip/brotli compression negotiated from Accept-Encoding
+
+    Bodies under `minimum_size`, responses that already carry a
+    Content-Encoding (precompressed payloads), already-compressed media types
+    and paths under `skip_prefixes` are sent as is. Streamed bodies are
+    compressed incrementally.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, skip_prefixes: Tuple[str, ...] = ()):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.skip_prefixes = tuple(skip_prefixes)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "HEAD" or scope["path"].startswith(self.skip_prefixes):
+            await self.app(scope, receive, send)
+            return
+        accept = None
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                accept = value.decode("latin-1")
+                break
+        encoding = negotiate(accept)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start = None
+        compressor = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                headers = message.get("headers", [])
+                passthrough = (
+                    message["status"] != 200
+                    or any(name == b"content-encoding" for name, _ in headers)
+                    or _skip_content_type(headers)
+                )
+                if passthrough:
+                    await send(message)
+                else:
+                    # Held until the first body chunk shows whether it is worth compressing
+                    start = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if start is not None:
+                # Whether or not this body is compressed, the URL's representation varies
+                base = _add_vary(start.get("headers", []), b"Accept-Encoding")
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(dict(start, headers=base))
+                    start = None
+                    await send(message)
+                    return
+                headers = [(name, value) for name, value in base if name != b"content-length"]
+                headers.append((b"content-encoding", encoding.encode()))
+                if not more_body:
+                    body = compress(body, encoding)
+                    headers.append((b"content-length", str(len(body)).encode()))
+                    await send(dict(start, headers=headers))
+                    start = None
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                compressor = _StreamCompressor(encoding)
+                await send(dict(start, headers=headers))
+                start = None
+
+            chunk = compressor.compress(body)
+            if not more_body:
+                chunk += compressor.finish()
+            if chunk or not more_body:
+                await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
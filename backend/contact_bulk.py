@@ -0,0 +1,67 @@
+from counters import increment_contact_counters, rebuild_contact_counters
+
+# action -> (field, value) for flag updates
+FLAG_ACTIONS = {
+    "mark_read": ("read", True),
+    "mark_unread": ("read", False),
+    "archive": ("archived", True),
+    "unarchive": ("archived", False),
+}
+
+
+def _and(query: dict, clause: dict) -> dict:
+    return {"$and": [query, clause]} if query else clause
+
+
+async def apply_bulk_action(db, action: str, query: dict, search_backend) -> int:
+    """Run one bulk action over the messages matching `query`
+
+    Returns the number of documents changed. Each flag change is a single
+    update_many that only matches documents whose flag actually flips, so
+    modified_count is the exact counter delta even when admins act on
+    overlapping selections.
+    """
+    collection = db.contact_messages
+
+    if action == "delete":
+        return await _delete(db, query, search_backend)
+
+    ids = None
+    if search_backend.tracks_documents:
+        # The in-process index needs the ids; pin the selection to them so the
+        # database and the index change the same documents
+        ids = [doc["_id"] async for doc in collection.find(query, {"_id": 1})]
+        query = {"_id": {"$in": ids}}
+
+    field, value = FLAG_ACTIONS[action]
+    # Documents without the archived field predate it and count as not archived
+    unchanged = {field: {"$ne": True}} if (field, value) == ("archived", True) else {field: not value}
+    result = await collection.update_many(_and(query, unchanged), {"$set": {field: value}})
+    if field == "read":
+        await increment_contact_counters(db, unread=-result.modified_count if value else result.modified_count)
+    for doc_id in ids or ():
+        search_backend.update(doc_id, {field: value})
+    return result.modified_count
+
+
+async def _delete(db, query: dict, search_backend) -> int:
+    """Delete the selection with one read and one delete_many
+
+    The read pins the selection to ids and tells how many of them are unread.
+    If a concurrent delete removed part of it first, that split is no longer
+    known and the counters are recomputed instead.
+    """
+    collection = db.contact_messages
+    docs = [doc async for doc in collection.find(query, {"_id": 1, "read": 1})]
+    if not docs:
+        return 0
+    ids = [doc["_id"] for doc in docs]
+    result = await collection.delete_many({"_id": {"$in": ids}})
+    if result.deleted_count == len(ids):
+        unread = sum(1 for doc in docs if doc.get("read") is False)
+        await increment_contact_counters(db, total=-len(ids), unread=-unread)
+    else:
+        await rebuild_contact_counters(db)
+    if search_backend.tracks_documents:
+        await search_backend.remove(ids)
+    return result.deleted_count
@@ -0,0 +1,161 @@
+from collections import deque
+from typing import AsyncIterator, NamedTuple, Optional
+import asyncio
+import logging
+
+from bson import ObjectId
+from bson.errors import InvalidId
+
+from serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+FEED_MODES = ("auto", "changestream", "local")
+REPLAY_LIMIT = 1000
+RETRY_MS = 3000
+KEEP_ALIVE = b": keep-alive\n\n"
+
+
+class FeedEvent(NamedTuple):
+    seq: int
+    id: ObjectId
+    frame: bytes
+
+
+def encode_event(doc: dict) -> bytes:
+    """SSE frame for a contact message; the ObjectId doubles as Last-Event-ID"""
+    return b"id: %s\nevent: contact\ndata: %s\n\n" % (str(doc["_id"]).encode(), dumps(doc))
+
+
+class ContactFeed:
+    """Fan-out of new contact messages to Server-Sent Events subscribers
+
+    Each insert is encoded once into a bounded history ring. Subscribers hold
+    no queue or timer of their own: they all await one shared asyncio.Event that
+    is swapped on every publish and pulsed by a single heartbeat task, then read
+    the frames they have not seen from the ring. Inserts come from a change
+    stream on replica sets, otherwise from publish_local() in this process.
+    """
+
+    def __init__(self, history: int = 256, heartbeat: float = 15.0):
+        self.heartbeat = heartbeat
+        self.subscribers = 0
+        self.uses_change_stream = False
+        self._events = deque(maxlen=history)
+        self._seq = 0
+        self._wakeup = asyncio.Event()
+        self._tasks = []
+
+    async def start(self, client, collection, mode: str = "auto"):
+        if mode not in FEED_MODES:
+            raise ValueError(f"Unknown contact feed mode: {mode}")
+        if mode == "auto":
+            mode = "changestream" if await _is_replica_set(client) else "local"
+        self.uses_change_stream = mode == "changestream"
+        self._tasks = [asyncio.create_task(self._tick())]
+        if self.uses_change_stream:
+            self._tasks.append(asyncio.create_task(self._watch(collection)))
+        logger.info("Contact feed fed by %s", mode)
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def publish(self, doc: dict):
+        self._seq += 1
+        self._events.append(FeedEvent(self._seq, doc["_id"], encode_event(doc)))
+        self._notify()
+
+    def publish_local(self, doc: dict):
+        """Publish an insert made by this process unless a change stream reports it"""
+        if not self.uses_change_stream:
+            self.publish(doc)
+
+    def _notify(self):
+        self._wakeup.set()
+        self._wakeup = asyncio.Event()
+
+    async def _tick(self):
+        while True:
+            await asyncio.sleep(self.heartbeat)
+            self._notify()
+
+    async def _watch(self, collection):
+        resume_token = None
+        pipeline = [{"$match": {"operationType": "insert"}}]
+        while True:
+            try:
+                async with collection.watch(pipeline, resume_after=resume_token) as stream:
+                    async for change in stream:
+                        resume_token = change["_id"]
+                        self.publish(change["fullDocument"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Contact change stream interrupted, resuming: %s", e)
+                await asyncio.sleep(1)
+
+    async def subscribe(self, collection, last_event_id: Optional[str] = None) -> AsyncIterator[bytes]:
+        """SSE byte stream: replay after `last_event_id`, then live inserts"""
+        self.subscribers += 1
+        try:
+            # Position taken before the replay so nothing published meanwhile is lost
+            seq = self._seq
+            last_id = _parse_id(last_event_id)
+            yield b"retry: %d\n\n" % RETRY_MS
+
+            # Ids replayed from the database, skipped if they also reach the ring
+            replayed = set()
+            if last_id is not None:
+                async for frame, last_id in _replay(collection, last_id):
+                    replayed.add(last_id)
+                    yield frame
+
+            while True:
+                wakeup = self._wakeup
+                if self._events and self._events[0].seq > seq + 1 and last_id is not None:
+                    # Fell behind the history ring: catch up from the database
+                    seq = self._seq
+                    replayed = set()
+                    async for frame, last_id in _replay(collection, last_id):
+                        replayed.add(last_id)
+                        yield frame
+                    continue
+                pending = [event for event in self._events if event.seq > seq]
+                if not pending:
+                    await wakeup.wait()
+                    if self._seq == seq:
+                        yield KEEP_ALIVE
+                    continue
+                seq = pending[-1].seq
+                for event in pending:
+                    if event.id not in replayed:
+                        last_id = event.id
+                        yield event.frame
+        finally:
+            self.subscribers -= 1
+
+
+def _parse_id(value: Optional[str]) -> Optional[ObjectId]:
+    if not value:
+        return None
+    try:
+        return ObjectId(value)
+    except (InvalidId, TypeError):
+        return None
+
+
+async def _replay(collection, after: ObjectId):
+    cursor = collection.find({"_id": {"$gt": after}}).sort("_id", 1).limit(REPLAY_LIMIT)
+    async for doc in cursor:
+        yield encode_event(doc), doc["_id"]
+
+
+async def _is_replica_set(client) -> bool:
+    try:
+        hello = await client.admin.command("hello")
+    except Exception:
+        return False
+    return "setName" in hello
@@ -0,0 +1,86 @@
+from pathlib import Path
+from typing import Dict
+import asyncio
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# Single document in the `counters` collection holding contact message totals
+CONTACT_COUNTERS_ID = "contact_messages"
+COUNTER_FIELDS = ("total", "unread")
+
+
+async def ensure_contact_counters(db) -> bool:
+    """Seed the counters document from the collection if it does not exist yet
+
+    Runs once per deployment: $setOnInsert makes concurrent workers agree on the
+    first seed and leaves existing (incrementally maintained) values alone.
+    Errors are logged so startup does not depend on MongoDB; the next read of
+    the counters seeds them instead.
+    """
+    try:
+        if await db.counters.find_one({"_id": CONTACT_COUNTERS_ID}, {"_id": 1}):
+            return False
+        values = await _count_contact_messages(db)
+        result = await db.counters.update_one(
+            {"_id": CONTACT_COUNTERS_ID}, {"$setOnInsert": values}, upsert=True
+        )
+    except Exception as e:
+        logger.error("Error seeding contact counters: %s", e)
+        return False
+    if result.upserted_id is not None:
+        logger.info("Seeded contact counters: %s", values)
+    return result.upserted_id is not None
+
+
+async def rebuild_contact_counters(db) -> Dict[str, int]:
+    """Recompute the counters from the collection (manual reconciliation: `python counters.py`)"""
+    values = await _count_contact_messages(db)
+    await db.counters.update_one({"_id": CONTACT_COUNTERS_ID}, {"$set": values}, upsert=True)
+    return values
+
+
+async def _count_contact_messages(db) -> Dict[str, int]:
+    return {
+        "total": await db.contact_messages.count_documents({}),
+        "unread": await db.contact_messages.count_documents({"read": False}),
+    }
+
+
+async def increment_contact_counters(db, total: int = 0, unread: int = 0):
+    """Atomically shift the counters; no-op when nothing changed
+
+    Never creates the document: until it is seeded, the seed's counts already
+    include these changes.
+    """
+    delta = {field: value for field, value in (("total", total), ("unread", unread)) if value}
+    if delta:
+        await db.counters.update_one({"_id": CONTACT_COUNTERS_ID}, {"$inc": delta})
+
+
+async def get_contact_counters(db) -> Dict[str, int]:
+    """O(1) read of the counters document, seeding it first if startup could not"""
+    doc = await db.counters.find_one({"_id": CONTACT_COUNTERS_ID})
+    if doc is None:
+        await ensure_contact_counters(db)
+        doc = await db.counters.find_one({"_id": CONTACT_COUNTERS_ID}) or {}
+    return {field: max(doc.get(field, 0), 0) for field in COUNTER_FIELDS}
+
+
+async def _main():
+    from dotenv import load_dotenv
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    load_dotenv(Path(__file__).parent / '.env')
+    client = AsyncIOMotorClient(os.environ['MONGO_URL'], tz_aware=True)
+    try:
+        values = await rebuild_contact_counters(client[os.environ['DB_NAME']])
+        print(f"Rebuilt contact counters: total={values['total']} unread={values['unread']}")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main())
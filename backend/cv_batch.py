@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Batch rendering of every CV variant (page size x layout) across a process pool.
+Results are written to an artifact directory with a manifest so the server can
+pre-warm its render cache from disk instead of rendering on first request.
+
+Usage: python cv_batch.py [--out DIR] [--workers N]
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+import argparse
+import itertools
+import json
+import os
+import time
+
+from cv_generator import CVGenerator, LAYOUTS, PAGE_SIZES, content_hash
+from portfolio_data import portfolio_data
+
+ROOT_DIR = Path(__file__).parent
+DEFAULT_ARTIFACT_DIR = ROOT_DIR / "cv_build"
+MANIFEST_NAME = "manifest.json"
+
+VARIANTS = tuple(itertools.product(PAGE_SIZES, LAYOUTS))
+
+
+def variant_filename(pagesize: str, layout: str) -> str:
+    return f"CV_Ali_Mansouri_{layout}_{pagesize}.pdf"
+
+
+def render_variant(data: dict, pagesize: str, layout: str) -> dict:
+    """Render one variant and return its bytes with timing (runs in a worker process)"""
+    started = time.perf_counter()
+    content = CVGenerator(data, pagesize=pagesize, layout=layout).generate().getvalue()
+    return {
+        "pagesize": pagesize,
+        "layout": layout,
+        "content": content,
+        "seconds": time.perf_counter() - started,
+    }
+
+
+def render_all(
+    output_dir: Path = DEFAULT_ARTIFACT_DIR,
+    data: Optional[dict] = None,
+    max_workers: Optional[int] = None,
+) -> List[dict]:
+    """Render the whole variant matrix in parallel and write it to `output_dir`"""
+    data = data if data is not None else portfolio_data
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    data_hash = content_hash(data)
+
+    with ProcessPoolExecutor(max_workers=max_workers or min(len(VARIANTS), os.cpu_count() or 1)) as pool:
+        futures = [pool.submit(render_variant, data, pagesize, layout) for pagesize, layout in VARIANTS]
+        results = [future.result() for future in futures]
+
+    manifest = {"hash": data_hash, "variants": []}
+    for result in results:
+        filename = variant_filename(result["pagesize"], result["layout"])
+        tmp_path = output_dir / (filename + ".tmp")
+        tmp_path.write_bytes(result.pop("content"))
+        os.replace(tmp_path, output_dir / filename)
+        result["file"] = filename
+        result["size"] = (output_dir / filename).stat().st_size
+        manifest["variants"].append(result)
+
+    tmp_manifest = output_dir / (MANIFEST_NAME + ".tmp")
+    tmp_manifest.write_text(json.dumps(manifest, indent=2))
+    os.replace(tmp_manifest, output_dir / MANIFEST_NAME)
+    return manifest["variants"]
+
+
+def load_manifest(output_dir: Path = DEFAULT_ARTIFACT_DIR) -> Optional[dict]:
+    """Read the manifest written by `render_all`, or None if absent/unreadable"""
+    try:
+        return json.loads((Path(output_dir) / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render every CV variant in parallel")
+    parser.add_argument("--out", type=Path, default=DEFAULT_ARTIFACT_DIR, help="artifact directory")
+    parser.add_argument("--workers", type=int, default=None, help="process pool size")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    variants = render_all(args.out, max_workers=args.workers)
+    for variant in variants:
+        print(f"{variant['file']:<45} {variant['seconds'] * 1000:8.1f} ms {variant['size']:>9} bytes")
+    print(f"{len(variants)} variants in {time.perf_counter() - started:.2f}s -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+from concurrent.futures import Executor, ProcessPoolExecutor
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+import asyncio
+import logging
+import time
+
+from artifacts import Artifact, ArtifactStore, map_file
+from cv_batch import load_manifest
+from cv_generator import CVGenerator, content_hash
+
+logger = logging.getLogger(__name__)
+
+
+def portfolio_hash(data: dict) -> str:
+    """Stable content hash of the canonical JSON form of the portfolio data"""
+    return content_hash(data)
+
+
+def render_cv_bytes(data: dict, pagesize: str = "a4", layout: str = "full") -> bytes:
+    """Render the CV to PDF bytes (runs inside a worker process)"""
+    return CVGenerator(data, pagesize=pagesize, layout=layout).generate().getvalue()
+
+
+def shared_name(key: str) -> str:
+    """Store file name for a "hash:pagesize:layout" cache key"""
+    data_hash, pagesize, layout = key.split(":")
+    return f"cv-{pagesize}-{layout}-{data_hash[:16]}.pdf"
+
+
+class CVRenderCache:
+    """Content-hash keyed cache of rendered CVs with single-flight rendering
+
+    With a shared `store`, renders are published as memory-mapped files: one
+    worker renders each variant (under the store's file lock) and every worker
+    serves the same mapped pages.
+    """
+
+    def __init__(self, max_workers: int = 1, max_entries: int = 8, store: Optional[ArtifactStore] = None):
+        self.max_workers = max_workers
+        self.max_entries = max_entries
+        self.store = store
+        self._executor: Optional[Executor] = None
+        self._artifacts: "OrderedDict[str, Artifact]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    async def get(self, data: dict, pagesize: str = "a4", layout: str = "full") -> Artifact:
+        """Return the artifact for `data`, rendering it at most once per hash and variant"""
+        key = f"{portfolio_hash(data)}:{pagesize}:{layout}"
+        artifact = self._artifacts.get(key)
+        if artifact is not None:
+            self._artifacts.move_to_end(key)
+            return artifact
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._render(key, data, pagesize, layout))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so a disconnecting client does not cancel the shared render
+        return await asyncio.shield(future)
+
+    async def _render(self, key: str, data: dict, pagesize: str, layout: str) -> Artifact:
+        if self.store is None:
+            content = await self._render_bytes(key, data, pagesize, layout)
+            return self._store(key, Artifact(content, time.time()))
+
+        name = shared_name(key)
+        artifact = self.store.get(name)
+        if artifact is None:
+            fd = await asyncio.to_thread(self.store.acquire, name)
+            try:
+                # Another worker may have published it while we waited
+                artifact = self.store.get(name)
+                if artifact is None:
+                    content = await self._render_bytes(key, data, pagesize, layout)
+                    artifact = self.store.put(name, content, replaces=f"cv-{pagesize}-{layout}-")
+            finally:
+                self.store.release(fd)
+        return self._store(key, artifact)
+
+    async def _render_bytes(self, key: str, data: dict, pagesize: str, layout: str) -> bytes:
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        content = await loop.run_in_executor(self.get_executor(), render_cv_bytes, data, pagesize, layout)
+        logger.info(
+            "Rendered CV %s %s/%s in %.3fs (%d bytes)",
+            key[:12], pagesize, layout, time.perf_counter() - started, len(content),
+        )
+        return content
+
+    def _store(self, key: str, artifact: Artifact) -> Artifact:
+        self._artifacts[key] = artifact
+        while len(self._artifacts) > self.max_entries:
+            self._artifacts.popitem(last=False)
+        return artifact
+
+    def preload(self, directory: Path, data: dict) -> int:
+        """Load pre-rendered variants written by cv_batch if they match `data`"""
+        manifest = load_manifest(directory)
+        data_hash = portfolio_hash(data)
+        if manifest is None or manifest.get("hash") != data_hash:
+            return 0
+
+        loaded = 0
+        for variant in manifest["variants"]:
+            path = Path(directory) / variant["file"]
+            try:
+                content, st = map_file(path)
+                artifact = Artifact(content, st.st_mtime)
+            except OSError:
+                continue
+            self._store(f"{data_hash}:{variant['pagesize']}:{variant['layout']}", artifact)
+            loaded += 1
+        return loaded
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
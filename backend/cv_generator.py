@@ -7,122 +7,204 @@ from reportlab.lib.enums import TA_LEFT, TA_CENTER
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from io import BytesIO
+from collections import OrderedDict
+from types import MappingProxyType
 from portfolio_data import portfolio_data
+import copy
+import hashlib
+import json
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Supported variants: page size name -> ReportLab size, and layouts
+PAGE_SIZES = {'a4': A4, 'letter': letter}
+LAYOUTS = ('full', 'condensed')
+
+# Condensed (one-page) layout tuning
+CONDENSED_SCALE = 0.85
+CONDENSED_SPACING = 0.35
+CONDENSED_MAX_RESPONSIBILITIES = 2
+CONDENSED_SKIP_SECTIONS = ('activities',)
+
+# Stylesheets shared by every CVGenerator in this process, per layout (built lazily, read-only)
+_STYLES = {}
+
+# Memoized flowables keyed by (layout, section, hash of the section's data)
+_SECTION_CACHE = OrderedDict()
+_SECTION_CACHE_SIZE = 64
+_SECTION_CACHE_LOCK = threading.Lock()
+
+# (section name, portfolio_data key the section depends on, builder method)
+SECTIONS = (
+    ('header', 'personal', '_create_header'),
+    ('profile', 'personal', '_create_profile'),
+    ('experience', 'experience', '_create_experience'),
+    ('projects', 'projects', '_create_projects'),
+    ('skills', 'skills', '_create_skills'),
+    ('education', 'education', '_create_education'),
+    ('certifications', 'certifications', '_create_certifications'),
+    ('languages', 'languages', '_create_languages'),
+    ('activities', 'activities', '_create_activities'),
+)
+
+
+def content_hash(data):
+    """Stable SHA-256 of the canonical JSON form of `data`"""
+    canonical = json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def get_styles(layout='full'):
+    """Return the process-wide read-only stylesheet for a layout"""
+    styles = _STYLES.get(layout)
+    if styles is None:
+        sheet = getSampleStyleSheet()
+        _setup_styles(sheet)
+        if layout == 'condensed':
+            _condense_styles(sheet, CONDENSED_SCALE, CONDENSED_SPACING)
+        styles = _STYLES[layout] = MappingProxyType(dict(sheet.byName))
+    return styles
+
+
+def clear_caches():
+    """Drop the shared stylesheets and memoized sections (used for cold benchmarks)"""
+    _STYLES.clear()
+    with _SECTION_CACHE_LOCK:
+        _SECTION_CACHE.clear()
+
+
+def _condense_styles(styles, scale, spacing):
+    """Shrink fonts and vertical spacing of the custom styles for the one-page layout"""
+    for name in ('CustomTitle', 'Subtitle', 'SectionHeader', 'JobTitle', 'CustomBody'):
+        style = styles[name]
+        style.fontSize *= scale
+        style.leading = style.fontSize * 1.2
+        style.spaceAfter *= spacing
+        style.spaceBefore *= spacing
+
+
+def _setup_styles(styles):
+    """Setup custom styles for the PDF"""
+    # Title style
+    styles.add(ParagraphStyle(
+        name='CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#1C3FAA'),
+        spaceAfter=12,
+        alignment=TA_CENTER
+    ))
+    
+    # Subtitle style
+    styles.add(ParagraphStyle(
+        name='Subtitle',
+        parent=styles['Heading2'],
+        fontSize=16,
+        textColor=colors.HexColor('#374151'),
+        spaceAfter=8,
+        alignment=TA_CENTER
+    ))
+    
+    # Section header
+    styles.add(ParagraphStyle(
+        name='SectionHeader',
+        parent=styles['Heading2'],
+        fontSize=14,
+        textColor=colors.HexColor('#1C3FAA'),
+        spaceAfter=10,
+        spaceBefore=15,
+        borderWidth=0,
+        borderPadding=0,
+        borderColor=colors.HexColor('#1C3FAA'),
+        borderRadius=None
+    ))
+    
+    # Job title style
+    styles.add(ParagraphStyle(
+        name='JobTitle',
+        parent=styles['Heading3'],
+        fontSize=12,
+        textColor=colors.HexColor('#1C3FAA'),
+        spaceAfter=4
+    ))
+    
+    # Body text
+    styles.add(ParagraphStyle(
+        name='CustomBody',
+        parent=styles['BodyText'],
+        fontSize=10,
+        textColor=colors.HexColor('#374151'),
+        spaceAfter=6
+    ))
+
 class CVGenerator:
-    def __init__(self):
-        self.data = portfolio_data
+    def __init__(self, data=None, pagesize='a4', layout='full'):
+        if pagesize not in PAGE_SIZES:
+            raise ValueError(f"Unknown page size: {pagesize}")
+        if layout not in LAYOUTS:
+            raise ValueError(f"Unknown layout: {layout}")
+        self.data = data if data is not None else portfolio_data
+        self.pagesize = pagesize
+        self.layout = layout
+        self.condensed = layout == 'condensed'
         self.buffer = BytesIO()
-        self.styles = getSampleStyleSheet()
-        self._setup_styles()
-
-    def _setup_styles(self):
-        """Setup custom styles for the PDF"""
-        # Title style
-        self.styles.add(ParagraphStyle(
-            name='CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#1C3FAA'),
-            spaceAfter=12,
-            alignment=TA_CENTER
-        ))
-        
-        # Subtitle style
-        self.styles.add(ParagraphStyle(
-            name='Subtitle',
-            parent=self.styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor('#374151'),
-            spaceAfter=8,
-            alignment=TA_CENTER
-        ))
-        
-        # Section header
-        self.styles.add(ParagraphStyle(
-            name='SectionHeader',
-            parent=self.styles['Heading2'],
-            fontSize=14,
-            textColor=colors.HexColor('#1C3FAA'),
-            spaceAfter=10,
-            spaceBefore=15,
-            borderWidth=0,
-            borderPadding=0,
-            borderColor=colors.HexColor('#1C3FAA'),
-            borderRadius=None
-        ))
-        
-        # Job title style
-        self.styles.add(ParagraphStyle(
-            name='JobTitle',
-            parent=self.styles['Heading3'],
-            fontSize=12,
-            textColor=colors.HexColor('#1C3FAA'),
-            spaceAfter=4
-        ))
-        
-        # Body text
-        self.styles.add(ParagraphStyle(
-            name='CustomBody',
-            parent=self.styles['BodyText'],
-            fontSize=10,
-            textColor=colors.HexColor('#374151'),
-            spaceAfter=6
-        ))
+        self.styles = get_styles(layout)
 
     def generate(self):
         """Generate the CV PDF"""
+        self.generate_to(self.buffer)
+        self.buffer.seek(0)
+        return self.buffer
+
+    def generate_to(self, output):
+        """Generate the CV PDF into a writable file-like object"""
         try:
+            margin = 36 if self.condensed else 50
             doc = SimpleDocTemplate(
-                self.buffer,
-                pagesize=A4,
-                rightMargin=50,
-                leftMargin=50,
-                topMargin=50,
-                bottomMargin=50
+                output,
+                pagesize=PAGE_SIZES[self.pagesize],
+                rightMargin=margin,
+                leftMargin=margin,
+                topMargin=margin,
+                bottomMargin=margin
             )
             
             story = []
-            
-            # Header
-            story.extend(self._create_header())
-            
-            # Profile
-            story.extend(self._create_profile())
-            
-            # Experience
-            story.extend(self._create_experience())
-            
-            # Projects
-            story.extend(self._create_projects())
-            
-            # Skills
-            story.extend(self._create_skills())
-            
-            # Education
-            story.extend(self._create_education())
-            
-            # Certifications
-            story.extend(self._create_certifications())
-            
-            # Languages
-            story.extend(self._create_languages())
-            
-            # Activities
-            story.extend(self._create_activities())
+            for name, key, builder in SECTIONS:
+                if self.condensed and name in CONDENSED_SKIP_SECTIONS:
+                    continue
+                story.extend(self._section(name, key, builder))
             
             # Build PDF
             doc.build(story)
-            self.buffer.seek(0)
-            return self.buffer
             
         except Exception as e:
-            logger.error(f"Error generating CV PDF: {str(e)}")
+            logger.error("Error generating CV PDF: %s", e)
             raise
 
+    def _section(self, name, key, builder):
+        """Return the section's flowables, reusing them while its data is unchanged"""
+        cache_key = (self.layout, name, content_hash(self.data[key]))
+        with _SECTION_CACHE_LOCK:
+            elements = _SECTION_CACHE.get(cache_key)
+            if elements is not None:
+                _SECTION_CACHE.move_to_end(cache_key)
+        if elements is None:
+            elements = getattr(self, builder)()
+            with _SECTION_CACHE_LOCK:
+                _SECTION_CACHE[cache_key] = elements
+                while len(_SECTION_CACHE) > _SECTION_CACHE_SIZE:
+                    _SECTION_CACHE.popitem(last=False)
+        # Shallow copies keep the parsed paragraph fragments but isolate layout state
+        return [copy.copy(element) for element in elements]
+
+    def _spacer(self, height):
+        """Vertical gap in inches, tightened for the condensed layout"""
+        scale = CONDENSED_SPACING if self.condensed else 1
+        return Spacer(1, height * scale * inch)
+
     def _create_header(self):
         """Create header section"""
         elements = []
@@ -140,7 +222,7 @@ class CVGenerator:
         </para>
         """
         elements.append(Paragraph(contact_info, self.styles['CustomBody']))
-        elements.append(Spacer(1, 0.2*inch))
+        elements.append(self._spacer(0.2))
         
         return elements
 
@@ -149,7 +231,7 @@ class CVGenerator:
         elements = []
         elements.append(Paragraph("PROFIL PROFESSIONNEL", self.styles['SectionHeader']))
         elements.append(Paragraph(self.data['personal']['profile'], self.styles['CustomBody']))
-        elements.append(Spacer(1, 0.2*inch))
+        elements.append(self._spacer(0.2))
         return elements
 
     def _create_experience(self):
@@ -158,14 +240,21 @@ class CVGenerator:
         elements.append(Paragraph("EXPÉRIENCE PROFESSIONNELLE", self.styles['SectionHeader']))
         
         for exp in self.data['experience']:
-            elements.append(Paragraph(exp['role'], self.styles['JobTitle']))
-            company_info = f"<b>{exp['company']}</b> | {exp['location']} | {exp['startDate']} - {exp['endDate']}"
-            elements.append(Paragraph(company_info, self.styles['CustomBody']))
+            responsibilities = exp['responsibilities']
+            if self.condensed:
+                # One line per role, followed by the first few responsibilities
+                role_info = f"<b>{exp['role']}</b> - {exp['company']} | {exp['startDate']} - {exp['endDate']}"
+                elements.append(Paragraph(role_info, self.styles['CustomBody']))
+                responsibilities = responsibilities[:CONDENSED_MAX_RESPONSIBILITIES]
+            else:
+                elements.append(Paragraph(exp['role'], self.styles['JobTitle']))
+                company_info = f"<b>{exp['company']}</b> | {exp['location']} | {exp['startDate']} - {exp['endDate']}"
+                elements.append(Paragraph(company_info, self.styles['CustomBody']))
             
-            for resp in exp['responsibilities']:
+            for resp in responsibilities:
                 elements.append(Paragraph(f"• {resp}", self.styles['CustomBody']))
             
-            elements.append(Spacer(1, 0.15*inch))
+            elements.append(self._spacer(0.15))
         
         return elements
 
@@ -175,11 +264,14 @@ class CVGenerator:
         elements.append(Paragraph("PROJETS", self.styles['SectionHeader']))
         
         for project in self.data['projects']:
+            tools = ", ".join(project['tools'])
+            if self.condensed:
+                elements.append(Paragraph(f"• <b>{project['name']}</b> - <i>{tools}</i>", self.styles['CustomBody']))
+                continue
             elements.append(Paragraph(f"<b>{project['name']}</b>", self.styles['JobTitle']))
             elements.append(Paragraph(project['description'], self.styles['CustomBody']))
-            tools = ", ".join(project['tools'])
             elements.append(Paragraph(f"<i>Technologies: {tools}</i>", self.styles['CustomBody']))
-            elements.append(Spacer(1, 0.1*inch))
+            elements.append(self._spacer(0.1))
         
         return elements
 
@@ -193,7 +285,7 @@ class CVGenerator:
             items = ", ".join(category['items'])
             elements.append(Paragraph(f"<b>{title}:</b> {items}", self.styles['CustomBody']))
         
-        elements.append(Spacer(1, 0.1*inch))
+        elements.append(self._spacer(0.1))
         return elements
 
     def _create_education(self):
@@ -202,10 +294,14 @@ class CVGenerator:
         elements.append(Paragraph("FORMATION", self.styles['SectionHeader']))
         
         for edu in self.data['education']:
+            if self.condensed:
+                info = f"• <b>{edu['degree']}</b> - {edu['institution']} ({edu['startDate']} - {edu['endDate']})"
+                elements.append(Paragraph(info, self.styles['CustomBody']))
+                continue
             elements.append(Paragraph(f"<b>{edu['degree']}</b>", self.styles['JobTitle']))
             info = f"{edu['institution']} | {edu['startDate']} - {edu['endDate']}"
             elements.append(Paragraph(info, self.styles['CustomBody']))
-            elements.append(Spacer(1, 0.1*inch))
+            elements.append(self._spacer(0.1))
         
         return elements
 
@@ -218,7 +314,7 @@ class CVGenerator:
             cert_text = f"• <b>{cert['name']}</b> - {cert['provider']} ({cert['status']})"
             elements.append(Paragraph(cert_text, self.styles['CustomBody']))
         
-        elements.append(Spacer(1, 0.1*inch))
+        elements.append(self._spacer(0.1))
         return elements
 
     def _create_languages(self):
@@ -226,11 +322,16 @@ class CVGenerator:
         elements = []
         elements.append(Paragraph("LANGUES", self.styles['SectionHeader']))
         
+        if self.condensed:
+            languages = " | ".join(f"<b>{lang['language']}</b>: {lang['level']}" for lang in self.data['languages'])
+            elements.append(Paragraph(languages, self.styles['CustomBody']))
+            return elements
+        
         for lang in self.data['languages']:
             lang_text = f"• <b>{lang['language']}</b>: {lang['level']}"
             elements.append(Paragraph(lang_text, self.styles['CustomBody']))
         
-        elements.append(Spacer(1, 0.1*inch))
+        elements.append(self._spacer(0.1))
         return elements
 
     def _create_activities(self):
@@ -0,0 +1,70 @@
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO, Callable
+import asyncio
+import os
+import tempfile
+
+from cv_generator import CVGenerator
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def render_cv_file(data: dict, pagesize: str, layout: str, path: str):
+    """Render the CV into `path` (runs inside a worker process)"""
+    CVGenerator(data, pagesize=pagesize, layout=layout).generate_to(path)
+
+
+def _unlink(path: Path):
+    path.unlink(missing_ok=True)
+
+
+class CVStreamer:
+    """Render fresh CVs in the render process pool and stream them from disk
+
+    ReportLab cannot emit a PDF page by page: it assembles the whole document
+    when it is saved and writes it in one call. Rendering into a temporary
+    file in a worker process keeps that copy, and the layout work, out of the
+    server process; a response then holds a single chunk at a time.
+    `max_concurrent` caps the renders queued at once.
+    """
+
+    def __init__(self, get_executor: Callable[[], Executor], max_concurrent: int = 4, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.get_executor = get_executor
+        self.chunk_size = chunk_size
+        self._slots = asyncio.Semaphore(max_concurrent)
+
+    async def render(self, data: dict, pagesize: str = "a4", layout: str = "full") -> BinaryIO:
+        """Render to an anonymous temporary file, returned open at offset 0
+
+        The path is unlinked at once, so the file disappears when it is closed
+        (by iter_file, or by the garbage collector if it is never streamed).
+        """
+        fd, name = tempfile.mkstemp(prefix="cv-stream-", suffix=".pdf")
+        os.close(fd)
+        path = Path(name)
+        loop = asyncio.get_running_loop()
+        async with self._slots:
+            future = loop.run_in_executor(self.get_executor(), render_cv_file, data, pagesize, layout, name)
+            try:
+                await asyncio.shield(future)
+            except BaseException:
+                if future.done():
+                    _unlink(path)
+                else:
+                    # Client went away mid-render: remove the file once the worker is done with it
+                    future.add_done_callback(lambda _: _unlink(path))
+                raise
+        try:
+            return open(path, "rb")
+        finally:
+            _unlink(path)
+
+    async def iter_file(self, f: BinaryIO) -> AsyncIterator[bytes]:
+        """Yield the rendered file in chunks, then close it"""
+        with f:
+            while True:
+                chunk = await asyncio.to_thread(f.read, self.chunk_size)
+                if not chunk:
+                    break
+                yield chunk
@@ -0,0 +1,101 @@
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
+import os
+import threading
+import time
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.environ.get(name, default))
+
+
+def client_options() -> dict:
+    """Motor pool and timeout settings, overridable from .env"""
+    return {
+        "maxPoolSize": _env_int('MONGO_MAX_POOL_SIZE', 100),
+        "minPoolSize": _env_int('MONGO_MIN_POOL_SIZE', 0),
+        "maxIdleTimeMS": _env_int('MONGO_MAX_IDLE_TIME_MS', 300000),
+        "waitQueueTimeoutMS": _env_int('MONGO_WAIT_QUEUE_TIMEOUT_MS', 10000),
+        "serverSelectionTimeoutMS": _env_int('MONGO_SERVER_SELECTION_TIMEOUT_MS', 5000),
+        "connectTimeoutMS": _env_int('MONGO_CONNECT_TIMEOUT_MS', 5000),
+        "socketTimeoutMS": _env_int('MONGO_SOCKET_TIMEOUT_MS', 30000),
+    }
+
+
+class PoolMonitor(monitoring.ConnectionPoolListener):
+    """Connection pool counters for this worker process
+
+    pymongo emits these events from Motor's executor threads, so counters are
+    lock-protected and checkout wait is measured per thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.open_connections = 0
+        self.checked_out = 0
+        self.checkouts = 0
+        self.checkout_failures = 0
+        self.pool_clears = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "open_connections": self.open_connections,
+                "checked_out": self.checked_out,
+                "checkouts": self.checkouts,
+                "checkout_failures": self.checkout_failures,
+                "pool_clears": self.pool_clears,
+                "avg_wait_ms": round(self.total_wait / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+            }
+
+    def connection_check_out_started(self, event):
+        self._local.started = time.perf_counter()
+
+    def connection_checked_out(self, event):
+        wait = time.perf_counter() - getattr(self._local, "started", time.perf_counter())
+        with self._lock:
+            self.checked_out += 1
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            self.checkout_failures += 1
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            self.checked_out -= 1
+
+    def connection_created(self, event):
+        with self._lock:
+            self.open_connections += 1
+
+    def connection_closed(self, event):
+        with self._lock:
+            self.open_connections -= 1
+
+    def pool_cleared(self, event):
+        with self._lock:
+            self.pool_clears += 1
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+
+def create_client(mongo_url: str, pool_monitor: PoolMonitor) -> AsyncIOMotorClient:
+    """Build the Motor client; no connection is made until the first operation"""
+    return AsyncIOMotorClient(mongo_url, tz_aware=True, event_listeners=[pool_monitor], **client_options())
@@ -0,0 +1,46 @@
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+import logging
+
+from search import SEARCH_WEIGHTS
+
+logger = logging.getLogger(__name__)
+
+# collection name -> list of (keys, options)
+INDEXES = {
+    "status_checks": [
+        ([("timestamp", ASCENDING), ("id", ASCENDING)], {"name": "timestamp_id"}),
+    ],
+    "status_rollups": [
+        (
+            [("granularity", ASCENDING), ("bucket", ASCENDING), ("client_name", ASCENDING)],
+            {"name": "granularity_bucket_client"},
+        ),
+    ],
+    "contact_messages": [
+        ([("created_at", DESCENDING), ("_id", DESCENDING)], {"name": "created_at_id"}),
+        ([("read", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)], {"name": "read_created_at_id"}),
+        ([("email", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)], {"name": "email_created_at_id"}),
+        (
+            [(field, TEXT) for field in SEARCH_WEIGHTS],
+            {"name": "contact_text", "weights": SEARCH_WEIGHTS, "default_language": "french"},
+        ),
+    ],
+}
+
+# Indexes replaced by one of the above, dropped when still present
+OBSOLETE_INDEXES = {
+    "contact_messages": ["email_created_at"],
+}
+
+
+async def ensure_indexes(db):
+    """Create the indexes the API queries rely on (no-op if they already exist)"""
+    for collection, indexes in INDEXES.items():
+        try:
+            await db[collection].create_indexes([IndexModel(keys, **options) for keys, options in indexes])
+            existing = await db[collection].index_information()
+            for name in OBSOLETE_INDEXES.get(collection, ()):
+                if name in existing:
+                    await db[collection].drop_index(name)
+        except Exception as e:
+            logger.error("Error creating indexes on %s: %s", collection, e)
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Streaming export of contact_messages and status_checks.
+Documents are read through a batched cursor in index order and encoded one
+batch at a time to CSV, NDJSON or Parquet (one row group per batch), optionally
+gzipped, so memory stays bounded whatever the collection size.
+
+Usage: python export.py contact_messages|status_checks [--format csv|ndjson|parquet]
+           [--gzip] [--since ISO] [--until ISO] [--read true|false] [--email E]
+           [--client-name N] [--batch-size N] [--out PATH]
+"""
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import AsyncIterator, List, Optional
+import argparse
+import asyncio
+import csv
+import io
+import os
+import sys
+import zlib
+
+from migrate_timestamps import parse_timestamp
+from serialization import dumps
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet export is disabled without pyarrow
+    pa = pq = None
+
+FORMATS = ("csv", "ndjson", "parquet")
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+DEFAULT_BATCH_SIZE = 1000
+
+# Exported columns and index-backed sort order per collection
+EXPORTS = {
+    "contact_messages": {
+        "columns": ["id", "name", "email", "subject", "message", "created_at", "read"],
+        "sort": [("created_at", 1), ("_id", 1)],
+        "projection": None,
+    },
+    "status_checks": {
+        "columns": ["id", "client_name", "timestamp"],
+        "sort": [("timestamp", 1), ("id", 1)],
+        "projection": {"_id": 0, "id": 1, "client_name": 1, "timestamp": 1},
+    },
+}
+
+
+class ParquetUnavailable(RuntimeError):
+    """Raised when a Parquet export is requested without pyarrow installed"""
+
+
+def _utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def build_query(
+    collection: str,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    read: Optional[bool] = None,
+    email: Optional[str] = None,
+    client_name: Optional[str] = None,
+) -> dict:
+    """Server-side filter for an export; inapplicable filters are ignored"""
+    if collection == "contact_messages":
+        query = {}
+        if read is not None:
+            query["read"] = read
+        if email:
+            query["email"] = email
+        if since is not None or until is not None:
+            query["created_at"] = {}
+            if since is not None:
+                query["created_at"]["$gte"] = _utc(since)
+            if until is not None:
+                query["created_at"]["$lt"] = _utc(until)
+        return query
+
+    clauses = []
+    if client_name:
+        clauses.append({"client_name": client_name})
+    # Unmigrated rows hold ISO strings, so both timestamp forms are matched
+    if since is not None or until is not None:
+        as_date, as_string = {}, {"$type": "string"}
+        if since is not None:
+            as_date["$gte"] = _utc(since)
+            as_string["$gte"] = _utc(since).isoformat()
+        if until is not None:
+            as_date["$lt"] = _utc(until)
+            as_string["$lt"] = _utc(until).isoformat()
+        clauses.append({"$or": [{"timestamp": as_date}, {"timestamp": as_string}]})
+    if not clauses:
+        return {}
+    return clauses[0] if len(clauses) == 1 else {"$and": clauses}
+
+
+def _row(collection: str, doc: dict) -> dict:
+    if collection == "contact_messages":
+        doc["id"] = str(doc.pop("_id"))
+    elif isinstance(doc.get("timestamp"), str):
+        doc["timestamp"] = parse_timestamp(doc["timestamp"])
+    return doc
+
+
+async def iter_batches(
+    db, collection: str, query: dict, batch_size: int = DEFAULT_BATCH_SIZE
+) -> AsyncIterator[List[dict]]:
+    """Yield lists of at most `batch_size` normalized rows in sort order"""
+    spec = EXPORTS[collection]
+    cursor = db[collection].find(query, spec["projection"]).sort(spec["sort"]).batch_size(batch_size)
+    batch = []
+    async for doc in cursor:
+        batch.append(_row(collection, doc))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def _encode_csv(batches, columns: List[str]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+    writer.writeheader()
+    async for batch in batches:
+        for row in batch:
+            writer.writerow({
+                key: value.isoformat() if isinstance(value, datetime) else value
+                for key, value in row.items()
+            })
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+async def _encode_ndjson(batches, columns: List[str]) -> AsyncIterator[bytes]:
+    async for batch in batches:
+        yield b"".join(dumps({key: row.get(key) for key in columns}) + b"\n" for row in batch)
+
+
+class _DrainBuffer:
+    """Append-only file object whose written bytes are taken after each row group"""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def take(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _parquet_schema(collection: str):
+    if collection == "contact_messages":
+        return pa.schema([
+            ("id", pa.string()), ("name", pa.string()), ("email", pa.string()),
+            ("subject", pa.string()), ("message", pa.string()),
+            ("created_at", pa.timestamp("us", tz="UTC")), ("read", pa.bool_()),
+        ])
+    return pa.schema([
+        ("id", pa.string()), ("client_name", pa.string()),
+        ("timestamp", pa.timestamp("us", tz="UTC")),
+    ])
+
+
+async def _encode_parquet(batches, columns: List[str], collection: str) -> AsyncIterator[bytes]:
+    schema = _parquet_schema(collection)
+    sink = _DrainBuffer()
+    writer = pq.ParquetWriter(pa.PythonFile(sink, mode="w"), schema)
+
+    def write(batch):
+        writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+
+    try:
+        async for batch in batches:
+            # Columnar encoding is CPU-bound, keep it off the event loop
+            await asyncio.to_thread(write, batch)
+            chunk = sink.take()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+    yield sink.take()
+
+
+async def _gzip(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def export_stream(
+    db,
+    collection: str,
+    format: str = "csv",
+    query: Optional[dict] = None,
+    gzip: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> AsyncIterator[bytes]:
+    """Encoded byte chunks for a whole collection export"""
+    if format == "parquet" and pa is None:
+        raise ParquetUnavailable("pyarrow is required for Parquet exports")
+    columns = EXPORTS[collection]["columns"]
+    batches = iter_batches(db, collection, query or {}, batch_size)
+    if format == "csv":
+        chunks = _encode_csv(batches, columns)
+    elif format == "ndjson":
+        chunks = _encode_ndjson(batches, columns)
+    else:
+        chunks = _encode_parquet(batches, columns, collection)
+    return _gzip(chunks) if gzip else chunks
+
+
+def export_filename(collection: str, format: str, gzip: bool) -> str:
+    return f"{collection}.{format}" + (".gz" if gzip else "")
+
+
+def _bool(value: str) -> bool:
+    if value.lower() not in ("true", "false"):
+        raise argparse.ArgumentTypeError("expected true or false")
+    return value.lower() == "true"
+
+
+async def _main(args):
+    from dotenv import load_dotenv
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    load_dotenv(Path(__file__).parent / '.env')
+    client = AsyncIOMotorClient(os.environ['MONGO_URL'], tz_aware=True)
+    query = build_query(args.collection, args.since, args.until, args.read, args.email, args.client_name)
+    output = open(args.out, "wb") if args.out else sys.stdout.buffer
+    try:
+        async for chunk in export_stream(
+            client[os.environ['DB_NAME']], args.collection, args.format, query, args.gzip, args.batch_size
+        ):
+            output.write(chunk)
+    finally:
+        if args.out:
+            output.close()
+        client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export a collection as CSV, NDJSON or Parquet")
+    parser.add_argument("collection", choices=sorted(EXPORTS))
+    parser.add_argument("--format", choices=FORMATS, default="csv")
+    parser.add_argument("--gzip", action="store_true")
+    parser.add_argument("--since", type=datetime.fromisoformat)
+    parser.add_argument("--until", type=datetime.fromisoformat)
+    parser.add_argument("--read", type=_bool)
+    parser.add_argument("--email")
+    parser.add_argument("--client-name")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--out", help="output file (default: stdout)")
+    asyncio.run(_main(parser.parse_args()))
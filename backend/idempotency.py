@@ -0,0 +1,53 @@
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Tuple
+import asyncio
+import time
+
+
+class IdempotencyConflict(Exception):
+    """The key was already used with a different request body"""
+
+
+class IdempotencyStore:
+    """TTL-bounded map from Idempotency-Key to the first response for that key
+
+    Concurrent requests with the same key share one in-flight call; failures
+    are not cached so the client can retry with the same key.
+    """
+
+    def __init__(self, ttl: float = 24 * 3600, max_entries: int = 10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, str, asyncio.Future]]" = OrderedDict()
+
+    def _evict(self, now: float):
+        # Runs before an insert, so leave room for one more entry
+        while self._entries:
+            key, (expires, _, _) = next(iter(self._entries.items()))
+            if expires > now and len(self._entries) < self.max_entries:
+                break
+            self._entries.popitem(last=False)
+
+    def __contains__(self, key: str) -> bool:
+        """Whether a live (unexpired) entry exists for `key`"""
+        entry = self._entries.get(key)
+        return entry is not None and entry[0] > time.monotonic()
+
+    async def run(self, key: str, fingerprint: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        now = time.monotonic()
+        self._evict(now)
+        entry = self._entries.get(key)
+        if entry is not None:
+            _, stored_fingerprint, future = entry
+            if stored_fingerprint != fingerprint:
+                raise IdempotencyConflict(key)
+            return await asyncio.shield(future)
+
+        future = asyncio.ensure_future(call())
+        # Entries are inserted in expiry order, so eviction only checks the head
+        self._entries[key] = (now + self.ttl, fingerprint, future)
+        try:
+            return await asyncio.shield(future)
+        except Exception:
+            self._entries.pop(key, None)
+            raise
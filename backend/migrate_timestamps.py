@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Online migration of status_checks.timestamp from ISO strings to BSON datetimes.
+Documents are converted in _id order with bulk_write; progress is recorded in
+the `migrations` collection so an interrupted run resumes where it stopped.
+
+Usage: python migrate_timestamps.py [--batch-size N]
+"""
+
+from datetime import datetime, timezone
+from pathlib import Path
+from pymongo import UpdateOne
+import argparse
+import asyncio
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+MIGRATION_ID = "status_checks_timestamp_datetime"
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Parse a stored ISO timestamp, assuming UTC when no offset is present"""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+async def migrate_status_timestamps(db, batch_size: int = 1000, pause: float = 0.0) -> int:
+    """Convert string timestamps in batches; safe to run while the API is serving"""
+    progress = await db.migrations.find_one({"_id": MIGRATION_ID}) or {}
+    if progress.get("done"):
+        return 0
+
+    last_id = progress.get("last_id")
+    converted = 0
+    while True:
+        query = {"timestamp": {"$type": "string"}}
+        if last_id is not None:
+            query["_id"] = {"$gt": last_id}
+        batch = await db.status_checks.find(query, {"timestamp": 1}).sort("_id", 1).limit(batch_size).to_list(batch_size)
+        if not batch:
+            break
+
+        operations = []
+        for doc in batch:
+            try:
+                value = parse_timestamp(doc["timestamp"])
+            except ValueError:
+                logger.error("Skipping unparsable timestamp on %s: %r", doc["_id"], doc["timestamp"])
+                continue
+            # Match on the original string so a concurrent rewrite is never clobbered
+            operations.append(UpdateOne(
+                {"_id": doc["_id"], "timestamp": doc["timestamp"]},
+                {"$set": {"timestamp": value}},
+            ))
+        modified = 0
+        if operations:
+            result = await db.status_checks.bulk_write(operations, ordered=False)
+            modified = result.modified_count
+            converted += modified
+
+        last_id = batch[-1]["_id"]
+        await db.migrations.update_one(
+            {"_id": MIGRATION_ID},
+            {"$set": {"last_id": last_id}, "$inc": {"converted": modified}},
+            upsert=True,
+        )
+        if pause:
+            await asyncio.sleep(pause)
+
+    await db.migrations.update_one(
+        {"_id": MIGRATION_ID},
+        {"$set": {"done": True, "finished_at": datetime.now(timezone.utc)}},
+        upsert=True,
+    )
+    logger.info("Timestamp migration finished, %s documents converted", converted)
+    return converted
+
+
+async def _main(batch_size: int):
+    from dotenv import load_dotenv
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    load_dotenv(Path(__file__).parent / '.env')
+    client = AsyncIOMotorClient(os.environ['MONGO_URL'], tz_aware=True)
+    try:
+        converted = await migrate_status_timestamps(client[os.environ['DB_NAME']], batch_size=batch_size)
+        print(f"Converted {converted} status_checks timestamps")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Convert status_checks timestamps to BSON datetimes")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    asyncio.run(_main(parser.parse_args().batch_size))
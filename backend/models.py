@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, Field
-from typing import Optional
+from typing import List, Literal, Optional
 from datetime import datetime
 
 class ContactMessage(BaseModel):
@@ -11,8 +11,25 @@ class ContactMessage(BaseModel):
 class ContactMessageDB(ContactMessage):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     read: bool = False
+    archived: bool = False
 
 class ContactResponse(BaseModel):
     success: bool
     message: str
-    id: Optional[str] = None
\ No newline at end of file
+    id: Optional[str] = None
+
+class ContactFilter(BaseModel):
+    read: Optional[bool] = None
+    archived: Optional[bool] = None
+    email: Optional[str] = None
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+
+class BulkContactAction(BaseModel):
+    action: Literal["mark_read", "mark_unread", "archive", "unarchive", "delete"]
+    ids: Optional[List[str]] = Field(None, min_length=1, max_length=10000)
+    filter: Optional[ContactFilter] = None
+
+class BulkContactResponse(BaseModel):
+    action: str
+    modified: int
@@ -0,0 +1,36 @@
+from bson import json_util
+from fastapi import HTTPException
+from typing import Any, Dict, List, Sequence, Tuple
+import base64
+
+# Sort specification: [(field, 1 | -1), ...]; the last field must be unique
+SortSpec = Sequence[Tuple[str, int]]
+
+
+def encode_cursor(doc: Dict[str, Any], sort: SortSpec) -> str:
+    """Opaque cursor pointing just past `doc` in `sort` order"""
+    values = [doc[field] for field, _ in sort]
+    raw = json_util.dumps(values).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: SortSpec) -> List[Any]:
+    """Decode a cursor produced by `encode_cursor`, raising 400 if malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json_util.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception:
+        raise HTTPException(status_code=400, detail="Curseur invalide")
+    if not isinstance(values, list) or len(values) != len(sort):
+        raise HTTPException(status_code=400, detail="Curseur invalide")
+    return values
+
+
+def keyset_filter(values: Sequence[Any], sort: SortSpec) -> Dict[str, Any]:
+    """Mongo filter selecting documents strictly after `values` in `sort` order"""
+    clauses = []
+    for i, (field, direction) in enumerate(sort):
+        clause = {prev_field: values[j] for j, (prev_field, _) in enumerate(sort[:i])}
+        clause[field] = {"$gt" if direction == 1 else "$lt": values[i]}
+        clauses.append(clause)
+    return clauses[0] if len(clauses) == 1 else {"$or": clauses}
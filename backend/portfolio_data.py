@@ -1,4 +1,4 @@
-# Portfolio data for CV generation - matches frontend mockData.js
+# Portfolio data - single source for the CV generator and the frontend (served by /api/portfolio)
 
 portfolio_data = {
     "personal": {
@@ -9,15 +9,18 @@ portfolio_data = {
         "linkedin": "https://www.linkedin.com/in/alouch-mansouri/",
         "github": "https://github.com/MansouriAli-1",
         "location": "Morocco",
+        "photo": "https://customer-assets.emergentagent.com/job_eb2d47e9-a0ee-497a-86e1-f55afe4473f2/artifacts/o21n7aka_Gemini_Generated_Image_fupz77fupz77fupz.png",
         "profile": "Data Analyst / BI Analyst spécialisé dans l'analyse de données, le développement de dashboards Power BI et la modélisation de Data Warehouse. Solide maîtrise de SQL, DAX, Power Query et Python pour transformer la donnée brute en indicateurs de performance exploitables. Capable de comprendre les besoins business, automatiser les flux et fournir des analyses fiables pour soutenir la prise de décision."
     },
     "experience": [
         {
+            "id": 1,
             "role": "BI Developer (Stage)",
             "company": "COPAG",
             "location": "Taroudant, Maroc",
             "startDate": "Mars 2025",
             "endDate": "Septembre 2025",
+            "current": False,
             "responsibilities": [
                 "Participation à la mise en place d'une architecture BI complète",
                 "Conception et modélisation de Data Warehouse",
@@ -27,11 +30,13 @@ portfolio_data = {
             ]
         },
         {
+            "id": 2,
             "role": "Data Analyst (Stage)",
             "company": "PORTNET",
             "location": "Casablanca, Maroc",
             "startDate": "Août 2024",
             "endDate": "Février 2025",
+            "current": False,
             "responsibilities": [
                 "Collecte et analyse des données logistiques et commerciales",
                 "Développement de modèles prédictifs en Machine Learning",
@@ -40,11 +45,13 @@ portfolio_data = {
             ]
         },
         {
+            "id": 3,
             "role": "Stage de Recherche - PFE",
             "company": "Faculté Polydisciplinaire",
             "location": "Taroudant, Maroc",
             "startDate": "Février 2024",
             "endDate": "Juillet 2024",
+            "current": False,
             "responsibilities": [
                 "Analyse comparative de l'apprentissage fédéré IoT vs centralisé",
                 "Conception de prototypes distribués (edge computing)",
@@ -55,19 +62,25 @@ portfolio_data = {
     ],
     "projects": [
         {
+            "id": 1,
             "name": "Analyse des accidents de la route",
             "description": "Tableau de bord interactif pour analyser les tendances par région, moment de la journée et type de véhicule",
-            "tools": ["Power BI", "Power Query", "DAX"]
+            "tools": ["Power BI", "Power Query", "DAX"],
+            "category": "Business Intelligence"
         },
         {
+            "id": 2,
             "name": "Maintenance prédictive",
             "description": "Anticipation des pannes d'équipements industriels à partir de données capteurs",
-            "tools": ["Python", "Pandas", "Scikit-learn", "Matplotlib", "Seaborn"]
+            "tools": ["Python", "Pandas", "Scikit-learn", "Matplotlib", "Seaborn"],
+            "category": "Machine Learning"
         },
         {
+            "id": 3,
             "name": "Analyse de sentiments – HESPRESS",
             "description": "Architecture Big Data pour l'ingestion et l'analyse en temps réel des commentaires",
-            "tools": ["Kafka", "Spark", "Hadoop", "MongoDB"]
+            "tools": ["Kafka", "Spark", "Hadoop", "MongoDB"],
+            "category": "Big Data"
         }
     ],
     "skills": {
@@ -94,27 +107,33 @@ portfolio_data = {
     },
     "education": [
         {
+            "id": 1,
             "degree": "Formation MS Power BI",
             "institution": "JobInTech - Inovadex Consulting",
             "startDate": "Septembre 2025",
-            "endDate": "En cours"
+            "endDate": "En cours",
+            "current": True
         },
         {
+            "id": 2,
             "degree": "Master Big Data et Intelligence Artificielle",
             "institution": "Faculté Polydisciplinaire, Taroudant",
             "startDate": "Septembre 2022",
-            "endDate": "Juillet 2024"
+            "endDate": "Juillet 2024",
+            "current": False
         },
         {
+            "id": 3,
             "degree": "Licence Professionnelle - Systèmes Informatiques Embarqués",
             "institution": "Faculté des Sciences Appliquées, Ait Melloul",
             "startDate": "Septembre 2018",
-            "endDate": "Juillet 2022"
+            "endDate": "Juillet 2022",
+            "current": False
         }
     ],
     "certifications": [
-        {"name": "Data Analyst", "provider": "DataCamp", "status": "En cours"},
-        {"name": "Power BI", "provider": "Microsoft", "status": "En cours"}
+        {"id": 1, "name": "Data Analyst", "provider": "DataCamp", "status": "En cours"},
+        {"id": 2, "name": "Power BI", "provider": "Microsoft", "status": "En cours"}
     ],
     "languages": [
         {"language": "Arabe", "level": "Maternelle"},
@@ -122,8 +141,8 @@ portfolio_data = {
         {"language": "Anglais", "level": "Intermédiaire"}
     ],
     "activities": [
-        {"organization": "ENACTUS", "period": "2019-2023", "role": "Team Leader"},
-        {"organization": "REEIAM", "period": "2021-2022", "role": "Vice-Président"},
-        {"organization": "Hult Prize", "period": "2022-2024", "role": "Mentor"}
+        {"id": 1, "organization": "ENACTUS", "period": "2019-2023", "role": "Team Leader"},
+        {"id": 2, "organization": "REEIAM", "period": "2021-2022", "role": "Vice-Président"},
+        {"id": 3, "organization": "Hult Prize", "period": "2022-2024", "role": "Mentor"}
     ]
 }
\ No newline at end of file
@@ -0,0 +1,136 @@
+from collections import defaultdict
+from typing import Dict, List, Optional
+import re
+import unicodedata
+
+from serialization import dumps
+
+# Canonical technology name -> alternative spellings found in CVs and job posts
+ALIASES = {
+    "Power BI": ["MS Power BI", "Microsoft Power BI", "PowerBI"],
+    "Power Query": ["M Query"],
+    "SQL Server": ["MS SQL Server", "Microsoft SQL Server", "MSSQL"],
+    "SSIS": ["SQL Server Integration Services"],
+    "SSAS": ["SQL Server Analysis Services"],
+    "Scikit-learn": ["sklearn", "scikit learn"],
+    "TensorFlow Federated": ["TFF"],
+    "TensorFlow": ["TF"],
+    "MongoDB": ["Mongo"],
+    "Spark": ["Apache Spark", "PySpark"],
+    "Kafka": ["Apache Kafka"],
+    "Hadoop": ["Apache Hadoop", "HDFS"],
+    "Hive": ["Apache Hive"],
+    "Machine Learning": ["ML"],
+    "Data Warehouse": ["DWH", "entrepôt de données"],
+}
+
+# Shortest name matched inside free text (single letters like "R" or "C" would
+# match everywhere, so they are only indexed from explicit tool/skill lists)
+MIN_TEXT_MATCH_LENGTH = 2
+
+_WORD_RE = re.compile(r"[a-z0-9+#]+")
+
+
+def normalize(name: str) -> str:
+    """Case-, accent- and punctuation-insensitive key for a technology name"""
+    decomposed = unicodedata.normalize("NFKD", name.lower())
+    folded = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(_WORD_RE.findall(folded))
+
+
+class PortfolioIndex:
+    """Technology -> projects, roles and skill categories that mention it
+
+    Built once from portfolio_data; every lookup is a normalized-name dict hit
+    returning pre-encoded JSON, so cost does not depend on portfolio size.
+    """
+
+    def __init__(self, data: dict, aliases: Optional[Dict[str, List[str]]] = None):
+        aliases = ALIASES if aliases is None else aliases
+        self._canonical: Dict[str, str] = {}
+        self._payloads: Dict[str, bytes] = {}
+
+        for canonical, names in aliases.items():
+            for name in [canonical] + names:
+                self._canonical[normalize(name)] = canonical
+
+        projects = defaultdict(list)
+        experience = defaultdict(list)
+        skills = defaultdict(list)
+
+        for project in data.get("projects", []):
+            summary = {"id": project.get("id"), "name": project["name"]}
+            for tool in dict.fromkeys(self._resolve(tool) for tool in project.get("tools", [])):
+                projects[tool].append(summary)
+
+        for key, category in data.get("skills", {}).items():
+            summary = {"key": key, "title": category["title"]}
+            for item in dict.fromkeys(self._resolve(item) for item in category.get("items", [])):
+                skills[item].append(summary)
+
+        vocabulary = {key for key in self._canonical if len(key) >= MIN_TEXT_MATCH_LENGTH}
+        self._max_words = max((len(key.split()) for key in vocabulary), default=1)
+        self._vocabulary = vocabulary
+        for role in data.get("experience", []):
+            summary = {"id": role.get("id"), "role": role["role"], "company": role["company"]}
+            mentioned = {}
+            for text in role.get("responsibilities", []):
+                for tool in self._mentions(text):
+                    mentioned[tool] = True
+            for tool in mentioned:
+                experience[tool].append(summary)
+
+        for tool in set(projects) | set(skills) | set(experience):
+            self._payloads[tool] = dumps({
+                "tool": tool,
+                "matched": True,
+                "facets": {
+                    "projects": len(projects[tool]),
+                    "experience": len(experience[tool]),
+                    "skills": len(skills[tool]),
+                },
+                "projects": projects[tool],
+                "experience": experience[tool],
+                "skills": skills[tool],
+            })
+
+    def _resolve(self, name: str) -> str:
+        """Canonical name for `name`, registering it if it has no alias entry"""
+        key = normalize(name)
+        canonical = self._canonical.get(key)
+        if canonical is None:
+            canonical = self._canonical[key] = name
+        return canonical
+
+    def _mentions(self, text: str):
+        """Canonical names found in free text, longest match first"""
+        words = normalize(text).split()
+        i = 0
+        while i < len(words):
+            for size in range(min(self._max_words, len(words) - i), 0, -1):
+                key = " ".join(words[i:i + size])
+                if key in self._vocabulary:
+                    yield self._canonical[key]
+                    i += size
+                    break
+            else:
+                i += 1
+
+    @property
+    def tools(self) -> List[str]:
+        return sorted(self._payloads)
+
+    def lookup(self, tool: str) -> bytes:
+        """Pre-encoded facet response for `tool` (zero counts when unknown)"""
+        canonical = self._canonical.get(normalize(tool))
+        payload = self._payloads.get(canonical) if canonical else None
+        if payload is None:
+            return dumps({
+                "tool": canonical or tool,
+                "matched": False,
+                "facets": {"projects": 0, "experience": 0, "skills": 0},
+                "projects": [],
+                "experience": [],
+                "skills": [],
+            })
+        return payload
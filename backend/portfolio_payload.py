@@ -0,0 +1,71 @@
+from typing import Dict, Iterable, Optional, Tuple
+import time
+
+from compression import compress
+from cv_generator import content_hash
+from serialization import dumps
+
+
+class EncodedPayload:
+    """Pre-encoded JSON body with its strong validator
+
+    Compressed variants are built once per content coding at the highest
+    quality and kept with the body, since the payload never changes.
+    """
+
+    def __init__(self, body: bytes, etag: str):
+        self.body = body
+        self.etag = etag
+        self._compressed: Dict[str, bytes] = {}
+
+    def compressed(self, encoding: str) -> bytes:
+        body = self._compressed.get(encoding)
+        if body is None:
+            body = self._compressed[encoding] = compress(self.body, encoding, static=True)
+        return body
+
+    def etag_for(self, encoding: Optional[str]) -> str:
+        """Strong validators must differ between content codings"""
+        return self.etag if encoding is None else self.etag[:-1] + "-" + encoding + '"'
+
+
+class PortfolioPayloads:
+    """portfolio_data encoded once per data version, per requested section set
+
+    The data hash is re-checked at most every `check_interval` seconds, so a
+    request normally costs one dict lookup.
+    """
+
+    def __init__(self, data: dict, check_interval: float = 30.0):
+        self.data = data
+        self.check_interval = check_interval
+        self.sections = tuple(data)
+        self._hash: Optional[str] = None
+        self._next_check = 0.0
+        self._payloads: Dict[Tuple[str, ...], EncodedPayload] = {}
+
+    def refresh(self) -> bool:
+        """Recompute the data hash; drop encoded payloads if it changed"""
+        self._next_check = time.monotonic() + self.check_interval
+        data_hash = content_hash(self.data)
+        if data_hash == self._hash:
+            return False
+        self._hash = data_hash
+        self.sections = tuple(self.data)
+        self._payloads = {}
+        return True
+
+    def get(self, sections: Optional[Iterable[str]] = None) -> EncodedPayload:
+        if time.monotonic() >= self._next_check:
+            self.refresh()
+
+        key = self.sections if sections is None else tuple(sorted(set(sections)))
+        payload = self._payloads.get(key)
+        if payload is None:
+            unknown = set(key) - set(self.sections)
+            if unknown:
+                raise KeyError(", ".join(sorted(unknown)))
+            body = dumps({name: self.data[name] for name in key})
+            etag = '"' + self._hash[:16] + "-" + content_hash(list(key))[:8] + '"'
+            payload = self._payloads[key] = EncodedPayload(body, etag)
+        return payload
@@ -0,0 +1,94 @@
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Set
+import time
+
+from metrics import Counter, Gauge, registry
+
+CACHE_HITS = registry.register(Counter(
+    "response_cache_hits_total", "Read responses served from the response cache", ("namespace",)))
+CACHE_MISSES = registry.register(Counter(
+    "response_cache_misses_total", "Read responses built because no fresh entry was cached", ("namespace",)))
+CACHE_EVICTIONS = registry.register(Counter(
+    "response_cache_evictions_total", "Response cache entries dropped, by reason", ("reason",)))
+CACHE_BYTES = registry.register(Gauge(
+    "response_cache_bytes", "Encoded response bytes held by the response cache"))
+
+
+class CachedResponse(NamedTuple):
+    namespace: str
+    body: bytes
+    headers: Dict[str, str]
+    expires: float
+
+
+class ResponseCache:
+    """LRU + TTL cache of encoded response bodies, invalidated per collection
+
+    Memory is bounded by both an entry count and a total body size. Writers
+    call invalidate(namespace); a read that started before the invalidation
+    carries the older generation and its result is not stored, so a slow query
+    cannot put stale data back after a write.
+    """
+
+    def __init__(self, ttl: float = 5.0, max_entries: int = 256, max_bytes: int = 32 * 1024 * 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._keys: Dict[str, Set[str]] = {}
+        self._generations: Dict[str, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    def generation(self, namespace: str) -> int:
+        return self._generations.get(namespace, 0)
+
+    def get(self, namespace: str, key: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires <= time.monotonic():
+            self._drop(key, "expired")
+            entry = None
+        if entry is None:
+            CACHE_MISSES.inc((namespace,))
+            return None
+        self._entries.move_to_end(key)
+        CACHE_HITS.inc((namespace,))
+        return entry
+
+    def put(self, namespace: str, key: str, body: bytes, headers: Dict[str, str], generation: int):
+        if not self.enabled or generation != self.generation(namespace) or len(body) > self.max_bytes:
+            return
+        if key in self._entries:
+            self._drop(key, None)
+        self._entries[key] = CachedResponse(namespace, body, headers, time.monotonic() + self.ttl)
+        self._keys.setdefault(namespace, set()).add(key)
+        self.size += len(body)
+        CACHE_BYTES.set(self.size)
+        while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+            self._drop(next(iter(self._entries)), "capacity")
+
+    def invalidate(self, namespace: str):
+        """Drop every entry of `namespace` and reject in-flight fills"""
+        self._generations[namespace] = self.generation(namespace) + 1
+        for key in list(self._keys.get(namespace, ())):
+            self._drop(key, "invalidated")
+
+    def _drop(self, key: str, reason: Optional[str]):
+        entry = self._entries.pop(key)
+        self._keys[entry.namespace].discard(key)
+        self.size -= len(entry.body)
+        CACHE_BYTES.set(self.size)
+        if reason is not None:
+            CACHE_EVICTIONS.inc((reason,))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def cache_key(request) -> str:
+    """Route path plus query parameters in a canonical order"""
+    params = sorted(request.query_params.multi_items())
+    return request.url.path + "?" + "&".join(f"{name}={value}" for name, value in params)
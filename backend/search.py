@@ -0,0 +1,211 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+import heapq
+import html
+import math
+import re
+import unicodedata
+
+# Fields searched and their relative weights (shared by both backends)
+SEARCH_WEIGHTS = {"subject": 5, "name": 3, "email": 3, "message": 1}
+HIT_FIELDS = ("name", "email", "subject", "created_at", "read")
+SNIPPET_RADIUS = 60
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _fold(text: str) -> str:
+    """Lowercase and strip accents so "Données" matches "donnees" """
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(_fold(text))
+
+
+def make_snippet(text: str, terms: Iterable[str], radius: int = SNIPPET_RADIUS) -> str:
+    """HTML-escaped excerpt around the first matching term, matches wrapped in <mark>"""
+    decomposed = unicodedata.normalize("NFKD", text)
+    # Base characters only, remembering their position in the decomposed text
+    offsets = [i for i, ch in enumerate(decomposed) if not unicodedata.combining(ch)]
+    folded = "".join(decomposed[i].lower()[:1] for i in offsets)
+
+    def span_end(index):
+        # Extend past combining marks so accents stay attached to their letter
+        while index < len(decomposed) and unicodedata.combining(decomposed[index]):
+            index += 1
+        return index
+
+    def piece(start, end):
+        return html.escape(unicodedata.normalize("NFC", decomposed[start:end]))
+
+    terms = [term for term in terms if term]
+    matches = []
+    if terms:
+        pattern = re.compile(r"\b(" + "|".join(re.escape(term) for term in terms) + r")")
+        matches = list(pattern.finditer(folded))
+    if not matches:
+        end = span_end(offsets[min(2 * radius, len(offsets)) - 1] + 1) if offsets else 0
+        return piece(0, end) + ("…" if end < len(decomposed) else "")
+
+    first = matches[0]
+    start = offsets[max(0, first.start() - radius)]
+    end = span_end(offsets[min(len(offsets), first.end() + radius) - 1] + 1)
+    parts = ["…" if start > 0 else ""]
+    cursor = start
+    for match in matches:
+        m_start = offsets[match.start()]
+        m_end = span_end(offsets[match.end() - 1] + 1)
+        if m_start < cursor or m_end > end:
+            continue
+        parts.append(piece(cursor, m_start))
+        parts.append("<mark>" + piece(m_start, m_end) + "</mark>")
+        cursor = m_end
+    parts.append(piece(cursor, end))
+    parts.append("…" if end < len(decomposed) else "")
+    return "".join(parts)
+
+
+def _hit(doc: dict, score: float, terms: List[str]) -> dict:
+    hit = {"_id": doc["_id"], "score": round(score, 4)}
+    for field in HIT_FIELDS:
+        if field in doc:
+            hit[field] = doc[field]
+    hit["snippet"] = make_snippet(doc.get("message", ""), terms)
+    return hit
+
+
+class MongoTextSearch:
+    """Ranked search through the contact_text index ($text / textScore)"""
+
+    name = "mongo"
+    # The text index follows the collection, bulk actions need not list ids
+    tracks_documents = False
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    async def search(self, query: str, limit: int, offset: int = 0) -> Tuple[List[dict], bool]:
+        projection = {field: 1 for field in HIT_FIELDS + ("message",)}
+        projection["score"] = {"$meta": "textScore"}
+        cursor = (
+            self.collection.find({"$text": {"$search": query}}, projection)
+            .sort([("score", {"$meta": "textScore"})])
+            .skip(offset)
+            .limit(limit + 1)
+        )
+        docs = await cursor.to_list(limit + 1)
+        terms = tokenize(query)
+        return [_hit(doc, doc["score"], terms) for doc in docs[:limit]], len(docs) > limit
+
+    async def add(self, doc: dict):
+        pass
+
+    async def remove(self, ids: Iterable):
+        pass
+
+    def update(self, doc_id, fields: dict):
+        pass
+
+
+class InMemorySearch:
+    """In-process inverted index with BM25 scoring, for tests and single-process runs
+
+    The index lives in one process and only sees that process's writes, and it
+    keeps every message body in memory: with several workers each would answer
+    from its own, diverging copy. create_search_backend refuses that setup.
+    """
+
+    name = "memory"
+    tracks_documents = True
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        # token -> {doc_id: weighted term frequency}
+        self._postings: Dict[str, Dict] = defaultdict(dict)
+        self._lengths: Dict = {}
+        self._docs: Dict = {}
+        self._total_length = 0
+
+    def __len__(self):
+        return len(self._docs)
+
+    async def load(self, collection, batch_size: int = 1000):
+        """Index every stored message, reading the collection in batches"""
+        projection = {field: 1 for field in HIT_FIELDS + ("message",)}
+        async for doc in collection.find({}, projection).batch_size(batch_size):
+            self._add(doc)
+
+    async def add(self, doc: dict):
+        self._add(doc)
+
+    def _add(self, doc: dict):
+        doc_id = doc["_id"]
+        if doc_id in self._docs:
+            self._remove(doc_id)
+        frequencies: Dict[str, float] = defaultdict(float)
+        length = 0
+        for field, weight in SEARCH_WEIGHTS.items():
+            tokens = tokenize(str(doc.get(field, "")))
+            length += len(tokens)
+            for token in tokens:
+                frequencies[token] += weight
+        for token, frequency in frequencies.items():
+            self._postings[token][doc_id] = frequency
+        self._lengths[doc_id] = length
+        self._total_length += length
+        self._docs[doc_id] = {field: doc[field] for field in HIT_FIELDS + ("message", "_id") if field in doc}
+
+    async def remove(self, ids: Iterable):
+        for doc_id in ids:
+            self._remove(doc_id)
+
+    def _remove(self, doc_id):
+        doc = self._docs.pop(doc_id, None)
+        if doc is None:
+            return
+        for token in set(tokenize(" ".join(str(doc.get(field, "")) for field in SEARCH_WEIGHTS))):
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[token]
+        self._total_length -= self._lengths.pop(doc_id, 0)
+
+    def update(self, doc_id, fields: dict):
+        """Refresh stored non-indexed fields (e.g. the read flag) of a document"""
+        doc = self._docs.get(doc_id)
+        if doc is not None:
+            doc.update({key: value for key, value in fields.items() if key in HIT_FIELDS})
+
+    async def search(self, query: str, limit: int, offset: int = 0) -> Tuple[List[dict], bool]:
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self._docs:
+            return [], False
+
+        count = len(self._docs)
+        average_length = self._total_length / count or 1
+        scores: Dict = defaultdict(float)
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, frequency in postings.items():
+                norm = self.k1 * (1 - self.b + self.b * self._lengths[doc_id] / average_length)
+                scores[doc_id] += idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+        top = heapq.nlargest(offset + limit + 1, scores.items(), key=lambda item: item[1])
+        page = top[offset:offset + limit]
+        return [_hit(self._docs[doc_id], score, terms) for doc_id, score in page], len(top) > offset + limit
+
+
+def create_search_backend(kind: str, collection, workers: int = 1):
+    """"mongo" uses the contact_text index, "memory" the in-process index (one worker only)"""
+    if kind == "memory":
+        if workers > 1:
+            raise ValueError("SEARCH_BACKEND=memory needs a single worker process (set SEARCH_BACKEND=mongo)")
+        return InMemorySearch()
+    return MongoTextSearch(collection)
@@ -0,0 +1,27 @@
+from bson import ObjectId
+from fastapi.responses import Response
+from typing import Any
+import orjson
+
+# Aware datetimes are written with a "Z" suffix, as pydantic does for UTC
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC
+
+
+def _default(value: Any):
+    if isinstance(value, ObjectId):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Encode with orjson; datetimes natively, ObjectIds as hex strings"""
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+class FastJSONResponse(Response):
+    """JSON response for trusted database reads: no per-item model validation"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
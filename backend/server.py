@@ -1,30 +1,158 @@
-from fastapi import FastAPI, APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi import FastAPI, APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
+from contextlib import asynccontextmanager
 import os
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict
-from typing import List
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
+from typing import List, Optional
+import asyncio
+import math
+import time
 import uuid
 from datetime import datetime, timezone
 
-from models import ContactMessage, ContactMessageDB, ContactResponse
-from cv_generator import CVGenerator
+from bson import ObjectId
+from bson.errors import InvalidId
+
+from models import BulkContactAction, BulkContactResponse, ContactMessage, ContactMessageDB, ContactResponse
+from cv_generator import LAYOUTS, PAGE_SIZES, content_hash
+from artifacts import ArtifactStore, MirroredFile, artifact_response
+from cv_batch import DEFAULT_ARTIFACT_DIR
+from cv_cache import CVRenderCache
+from compression import CompressionMiddleware, negotiate, supported_encodings
+from contact_bulk import apply_bulk_action
+from contact_feed import ContactFeed
+from counters import ensure_contact_counters, get_contact_counters, increment_contact_counters
+from cv_stream import CVStreamer
+from database import PoolMonitor, create_client
+from db_indexes import ensure_indexes
+from export import EXPORTS, FORMATS, MEDIA_TYPES, ParquetUnavailable, build_query, export_filename, export_stream
+from idempotency import IdempotencyConflict, IdempotencyStore
+from metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, MetricsMiddleware, registry as metrics_registry
+from migrate_timestamps import migrate_status_timestamps, parse_timestamp
+from search import create_search_backend
+from status_rollups import (
+    DEFAULT_WINDOWS, GRANULARITIES, MAX_BUCKETS, backfill_status_rollups, ensure_rollup_cutoff,
+    query_stats, record_status_checks,
+)
+from serialization import FastJSONResponse, dumps as fast_dumps
+from structured_logging import RequestContextMiddleware, setup_logging
+from pagination import decode_cursor, encode_cursor, keyset_filter
+from portfolio_data import portfolio_data
+from portfolio_index import PortfolioIndex
+from portfolio_payload import PortfolioPayloads
+from rate_limit import TokenBucketLimiter
+from response_cache import ResponseCache, cache_key
+from write_buffer import WriteBehindBuffer
 
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# MongoDB connection
+# MongoDB connection (client created in the lifespan handler, per worker)
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ['DB_NAME']]
+pool_monitor = PoolMonitor()
+client = None
+db = None
+
+# Contact message search: "mongo" (text index) or "memory" (in-process inverted
+# index, single worker only: each process would index only its own writes)
+SEARCH_BACKEND = os.environ.get('SEARCH_BACKEND', 'mongo')
+search_backend = None
+
+# Directory of memory-mapped PDFs whose pages are shared by all workers
+cv_store = ArtifactStore(Path(os.environ.get('CV_SHARED_DIR', DEFAULT_ARTIFACT_DIR / 'shared')))
+
+# The repo's CV PDF may be rewritten in place, so it is never mapped itself:
+# a copy is published to the store whenever it changes and that copy is mapped
+cv_artifact = MirroredFile(ROOT_DIR / "CV_Ali_Mansouri.pdf", cv_store)
+
+# CV rendered from portfolio_data, re-rendered only when the data hash changes;
+# renders are published to the shared store so one worker renders for all
+cv_render_cache = CVRenderCache(
+    max_workers=int(os.environ.get('CV_RENDER_WORKERS', '1')),
+    store=cv_store,
+)
+
+# Uncached CV renders, made in the render pool and streamed from a temporary file
+cv_streamer = CVStreamer(
+    cv_render_cache.get_executor,
+    max_concurrent=int(os.environ.get('CV_STREAM_CONCURRENCY', '4')),
+)
+
+# portfolio_data encoded once and re-encoded only when its hash changes
+portfolio_payloads = PortfolioPayloads(
+    portfolio_data,
+    check_interval=float(os.environ.get('PORTFOLIO_CHECK_SECONDS', '30')),
+)
+PORTFOLIO_CACHE_CONTROL = os.environ.get(
+    'PORTFOLIO_CACHE_CONTROL', 'public, max-age=3600, stale-while-revalidate=86400'
+)
+
+# Responses smaller than this are sent uncompressed
+COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', '1024'))
+
+# Technology -> projects / roles / skill categories, built once at load time
+portfolio_index = PortfolioIndex(portfolio_data)
+
+# Live feed of new contact messages: change stream on replica sets, else in-process
+CONTACT_FEED_MODE = os.environ.get('CONTACT_FEED_MODE', 'auto')
+contact_feed = ContactFeed(
+    history=int(os.environ.get('CONTACT_FEED_HISTORY', '256')),
+    heartbeat=float(os.environ.get('CONTACT_FEED_HEARTBEAT_SECONDS', '15')),
+)
+
+# Encoded GET /api/status and /api/contact-messages bodies, dropped on writes
+response_cache = ResponseCache(
+    ttl=float(os.environ.get('RESPONSE_CACHE_TTL_SECONDS', '5')),
+    max_entries=int(os.environ.get('RESPONSE_CACHE_MAX_ENTRIES', '256')),
+    max_bytes=int(os.environ.get('RESPONSE_CACHE_MAX_BYTES', str(32 * 1024 * 1024))),
+)
+
+# Opt-in write-behind batching for contact and status inserts
+WRITE_BEHIND = os.environ.get('WRITE_BEHIND', '0') == '1'
+write_buffers = {}
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global client, db, search_backend
+    client = create_client(mongo_url, pool_monitor)
+    db = client[os.environ['DB_NAME']]
+
+    await ensure_indexes(db)
+    await ensure_contact_counters(db)
+    await ensure_rollup_cutoff(db)
+    search_backend = create_search_backend(
+        SEARCH_BACKEND, db.contact_messages, workers=int(os.environ.get('WEB_CONCURRENCY', '1'))
+    )
+    if SEARCH_BACKEND == 'memory':
+        await search_backend.load(db.contact_messages)
+        logger.info("Indexed %s contact messages in memory", len(search_backend))
+    start_write_buffers()
+    await contact_feed.start(client, db.contact_messages, CONTACT_FEED_MODE)
+    if os.environ.get('MIGRATE_STATUS_TIMESTAMPS', '0') == '1':
+        app.state.timestamp_migration = asyncio.create_task(migrate_status_timestamps(db))
+    if os.environ.get('BACKFILL_STATUS_ROLLUPS', '0') == '1':
+        app.state.rollup_backfill = asyncio.create_task(backfill_status_rollups(db))
+    prewarm_cv_cache()
+    portfolio_payloads.refresh()
+    precompress_portfolio()
+
+    yield
+
+    await contact_feed.stop()
+    # Flush buffered inserts before the connection goes away
+    for buffer in write_buffers.values():
+        await buffer.stop()
+    write_buffers.clear()
+    client.close()
+    cv_render_cache.shutdown()
 
 # Create the main app without a prefix
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -51,104 +179,574 @@ async def create_status_check(input: StatusCheckCreate):
     status_dict = input.model_dump()
     status_obj = StatusCheck(**status_dict)
     
-    # Convert to dict and serialize datetime to ISO string for MongoDB
+    # Stored as a native BSON datetime so range queries use the date index
     doc = status_obj.model_dump()
-    doc['timestamp'] = doc['timestamp'].isoformat()
     
-    _ = await db.status_checks.insert_one(doc)
+    if WRITE_BEHIND:
+        # Rollups are updated once per flushed batch
+        doc['_id'] = ObjectId()
+        await write_buffers['status_checks'].put(doc)
+    else:
+        _ = await db.status_checks.insert_one(doc)
+        try:
+            await record_status_checks(db, [(status_obj.client_name, status_obj.timestamp)])
+        except Exception as e:
+            logger.error("Error updating status rollups: %s", e)
+    response_cache.invalidate('status_checks')
     return status_obj
 
+# Keyset order for status checks (backed by the timestamp_id index)
+STATUS_SORT = [("timestamp", 1), ("id", 1)]
+STATUS_PAGE_SIZE = 1000
+STATUS_BATCH_SIZE = 500
+
+def _status_query(after: Optional[str], since: Optional[datetime]) -> dict:
+    # Until migrate_timestamps has run, rows may hold ISO strings or datetimes.
+    # BSON sorts every string before every date, so both forms are matched.
+    clauses = []
+    if since is not None:
+        # Stored strings are UTC ("+00:00"), so compare in UTC as well
+        since = since.replace(tzinfo=timezone.utc) if since.tzinfo is None else since.astimezone(timezone.utc)
+        clauses.append({"$or": [
+            {"timestamp": {"$gte": since}},
+            {"timestamp": {"$type": "string", "$gte": since.isoformat()}},
+        ]})
+    if after:
+        values = decode_cursor(after, STATUS_SORT)
+        keyset = keyset_filter(values, STATUS_SORT)
+        if isinstance(values[0], str):
+            keyset = {"$or": [keyset, {"timestamp": {"$type": "date"}}]}
+        clauses.append(keyset)
+    if not clauses:
+        return {}
+    return clauses[0] if len(clauses) == 1 else {"$and": clauses}
+
+# Projection matching the StatusCheck output shape
+STATUS_PROJECTION = {"_id": 0, "id": 1, "client_name": 1, "timestamp": 1}
+
+# Database reads are trusted and encoded directly unless VALIDATE_DB_READS=1
+VALIDATE_DB_READS = os.environ.get('VALIDATE_DB_READS', '0') == '1'
+status_list_adapter = TypeAdapter(List[StatusCheck])
+
+async def _stream_status_ndjson(cursor):
+    async for check in cursor:
+        if isinstance(check['timestamp'], str):
+            check['timestamp'] = parse_timestamp(check['timestamp'])
+        yield fast_dumps(check) + b"\n"
+
 @api_router.get("/status", response_model=List[StatusCheck])
-async def get_status_checks():
-    # Exclude MongoDB's _id field from the query results
-    status_checks = await db.status_checks.find({}, {"_id": 0}).to_list(1000)
+async def get_status_checks(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1),
+    after: Optional[str] = None,
+    since: Optional[datetime] = None,
+    format: str = Query("json", pattern="^(json|ndjson)$"),
+):
+    query = _status_query(after, since)
+    cursor = db.status_checks.find(query, STATUS_PROJECTION).sort(STATUS_SORT).batch_size(STATUS_BATCH_SIZE)
+
+    if format == "ndjson":
+        if limit is not None:
+            cursor = cursor.limit(limit)
+        return StreamingResponse(_stream_status_ndjson(cursor), media_type="application/x-ndjson")
+
+    key = cache_key(request)
+    cached = response_cache.get('status_checks', key)
+    if cached is not None:
+        return Response(content=cached.body, media_type="application/json", headers=cached.headers)
+    generation = response_cache.generation('status_checks')
+
+    page_size = min(limit or STATUS_PAGE_SIZE, STATUS_PAGE_SIZE)
+    status_checks = await cursor.limit(page_size).to_list(page_size)
+
+    headers = {}
+    if len(status_checks) == page_size:
+        headers["X-Next-Cursor"] = encode_cursor(status_checks[-1], STATUS_SORT)
     
-    # Convert ISO string timestamps back to datetime objects
+    # Rows not yet migrated still hold ISO strings
     for check in status_checks:
         if isinstance(check['timestamp'], str):
-            check['timestamp'] = datetime.fromisoformat(check['timestamp'])
+            check['timestamp'] = parse_timestamp(check['timestamp'])
     
-    return status_checks
+    if VALIDATE_DB_READS:
+        status_checks = status_list_adapter.dump_python(status_list_adapter.validate_python(status_checks))
+    response = FastJSONResponse(status_checks, headers=headers)
+    response_cache.put('status_checks', key, response.body, headers, generation)
+    return response
 
-# Contact form endpoint
-@api_router.post("/contact", response_model=ContactResponse)
-async def submit_contact(contact: ContactMessage):
+# Per-client status check counts over time, answered from the rollups
+@api_router.get("/status/stats")
+async def get_status_stats(
+    granularity: str = Query("hour", pattern="^(" + "|".join(GRANULARITIES) + ")$"),
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    client_name: Optional[str] = None,
+):
+    until = until or datetime.now(timezone.utc)
+    if until.tzinfo is None:
+        until = until.replace(tzinfo=timezone.utc)
+    since = since or until - DEFAULT_WINDOWS[granularity]
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    if since >= until:
+        raise HTTPException(status_code=400, detail="since doit précéder until")
+    if (until - since) / GRANULARITIES[granularity] > MAX_BUCKETS:
+        raise HTTPException(status_code=400, detail="Plage trop large pour cette granularité")
+
+    stats = await query_stats(db, granularity, since, until, client_name)
+    return FastJSONResponse({"granularity": granularity, "since": since, "until": until, **stats})
+
+# Portfolio content for the frontend (replaces the bundled mockData.js)
+@api_router.get("/portfolio")
+async def get_portfolio(request: Request, sections: Optional[str] = None):
+    requested = None
+    if sections:
+        requested = [name.strip() for name in sections.split(",") if name.strip()]
+    try:
+        payload = portfolio_payloads.get(requested)
+    except KeyError as e:
+        raise HTTPException(status_code=400, detail=f"Sections inconnues: {e.args[0]}")
+
+    encoding = negotiate(request.headers.get("accept-encoding"))
+    if len(payload.body) < COMPRESSION_MIN_SIZE:
+        encoding = None
+    headers = {
+        "ETag": payload.etag_for(encoding),
+        "Cache-Control": PORTFOLIO_CACHE_CONTROL,
+        "Vary": "Accept-Encoding",
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and headers["ETag"] in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    if encoding is None:
+        return Response(content=payload.body, media_type="application/json", headers=headers)
+    # Compressed once per payload; the middleware passes Content-Encoding responses through
+    headers["Content-Encoding"] = encoding
+    return Response(content=payload.compressed(encoding), media_type="application/json", headers=headers)
+
+@api_router.get("/portfolio/search")
+async def search_portfolio(tool: str = Query(..., min_length=1, max_length=100)):
+    return Response(
+        content=portfolio_index.lookup(tool),
+        media_type="application/json",
+        headers={"Cache-Control": PORTFOLIO_CACHE_CONTROL},
+    )
+
+# Contact form abuse protection (checked before the body is validated)
+contact_ip_limiter = TokenBucketLimiter(
+    capacity=float(os.environ.get('CONTACT_IP_BURST', '5')),
+    refill_per_second=float(os.environ.get('CONTACT_IP_PER_MINUTE', '5')) / 60,
+)
+contact_email_limiter = TokenBucketLimiter(
+    capacity=float(os.environ.get('CONTACT_EMAIL_BURST', '3')),
+    refill_per_second=float(os.environ.get('CONTACT_EMAIL_PER_HOUR', '10')) / 3600,
+)
+contact_idempotency = IdempotencyStore(ttl=float(os.environ.get('IDEMPOTENCY_TTL_SECONDS', '86400')))
+TRUST_FORWARDED_FOR = os.environ.get('TRUST_FORWARDED_FOR', '0') == '1'
+
+def _client_ip(request: Request) -> str:
+    if TRUST_FORWARDED_FOR:
+        # Earlier entries are client-supplied; the right-most one was appended
+        # by the trusted proxy and is the address it actually saw
+        hops = [hop.strip() for value in request.headers.getlist("x-forwarded-for") for hop in value.split(",")]
+        hops = [hop for hop in hops if hop]
+        if hops:
+            return hops[-1]
+    return request.client.host if request.client else "unknown"
+
+async def contact_rate_limit(request: Request):
+    # Replays of a known Idempotency-Key get the stored response, free of charge
+    if request.headers.get("idempotency-key") in contact_idempotency:
+        return
+    retry_after = contact_ip_limiter.acquire(_client_ip(request))
+    if not retry_after:
+        try:
+            payload = await request.json()
+        except ValueError:
+            payload = None
+        email = payload.get("email") if isinstance(payload, dict) else None
+        if isinstance(email, str) and email:
+            retry_after = contact_email_limiter.acquire(email.strip().lower())
+    if retry_after:
+        raise HTTPException(
+            status_code=429,
+            detail="Trop de messages envoyés, veuillez réessayer plus tard",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+async def _index_and_publish(doc: dict):
+    """Make a stored message visible to search and feed subscribers (failures are logged)"""
+    try:
+        await search_backend.add(doc)
+    except Exception as e:
+        logger.error("Error indexing contact message %s: %s", doc.get('_id'), e)
+    try:
+        contact_feed.publish_local(doc)
+    except Exception as e:
+        logger.error("Error publishing contact message %s: %s", doc.get('_id'), e)
+
+async def _save_contact(contact: ContactMessage) -> ContactResponse:
     try:
         # Create DB model with timestamp and read status
         contact_db = ContactMessageDB(**contact.dict())
         
-        # Insert into MongoDB
-        result = await db.contact_messages.insert_one(contact_db.dict())
+        doc = contact_db.dict()
         
-        return ContactResponse(
-            success=True,
-            message="Message envoyé avec succès",
-            id=str(result.inserted_id)
-        )
+        if WRITE_BEHIND:
+            # ID generated here so the client gets it before the batch is flushed
+            doc['_id'] = ObjectId()
+            await write_buffers['contact_messages'].put(doc)
+            inserted_id = doc['_id']
+        else:
+            # Insert into MongoDB
+            result = await db.contact_messages.insert_one(doc)
+            inserted_id = result.inserted_id
     except Exception as e:
-        logging.error(f"Error saving contact message: {str(e)}")
+        logger.error("Error saving contact message: %s", e)
         raise HTTPException(status_code=500, detail="Erreur lors de l'envoi du message")
 
+    if not WRITE_BEHIND:
+        # The message is stored: from here on failures are logged, not reported,
+        # so a retry with the same Idempotency-Key cannot insert it twice.
+        # Write-behind batches do the same once they are flushed.
+        response_cache.invalidate('contact_messages')
+        try:
+            await increment_contact_counters(db, total=1, unread=1)
+        except Exception as e:
+            logger.error("Error updating contact counters (see rebuild_contact_counters): %s", e)
+        await _index_and_publish(doc)
+
+    return ContactResponse(
+        success=True,
+        message="Message envoyé avec succès",
+        id=str(inserted_id)
+    )
+
+# Contact form endpoint
+@api_router.post("/contact", response_model=ContactResponse, dependencies=[Depends(contact_rate_limit)])
+async def submit_contact(contact: ContactMessage, idempotency_key: Optional[str] = Header(None, max_length=255)):
+    if not idempotency_key:
+        return await _save_contact(contact)
+
+    # Replays of the same key return the first response without touching MongoDB
+    fingerprint = content_hash(contact.model_dump())
+    try:
+        return await contact_idempotency.run(idempotency_key, fingerprint, lambda: _save_contact(contact))
+    except IdempotencyConflict:
+        raise HTTPException(status_code=409, detail="Idempotency-Key déjà utilisée pour un autre message")
+
 # Download CV endpoint
-@api_router.get("/download-cv")
-async def download_cv():
+@api_router.api_route("/download-cv", methods=["GET", "HEAD"])
+async def download_cv(request: Request):
     try:
-        # Path to the CV PDF file
-        cv_path = ROOT_DIR / "CV_Ali_Mansouri.pdf"
-        
-        if not cv_path.exists():
-            raise HTTPException(status_code=404, detail="CV non trouvé")
-        
-        # Read the PDF file
-        with open(cv_path, "rb") as pdf_file:
-            pdf_content = pdf_file.read()
-        
-        # Return as streaming response
-        from io import BytesIO
-        pdf_buffer = BytesIO(pdf_content)
-        
-        return StreamingResponse(
-            pdf_buffer,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": "attachment; filename=CV_Ali_Mansouri.pdf"
-            }
-        )
+        artifact = cv_artifact.get()
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="CV non trouvé")
     except Exception as e:
-        logging.error(f"Error serving CV PDF: {str(e)}")
+        logger.error("Error serving CV PDF: %s", e)
         raise HTTPException(status_code=500, detail="Erreur lors du téléchargement du PDF")
 
-# Get all contact messages (admin endpoint)
+    return artifact_response(request, artifact, filename="CV_Ali_Mansouri.pdf")
+
+# Generated CV endpoint (rendered from portfolio_data)
+@api_router.api_route("/generate-cv", methods=["GET", "HEAD"])
+async def generate_cv(request: Request, size: str = "a4", layout: str = "full"):
+    if size not in PAGE_SIZES or layout not in LAYOUTS:
+        raise HTTPException(status_code=400, detail="Format de CV inconnu")
+
+    try:
+        artifact = await cv_render_cache.get(portfolio_data, pagesize=size, layout=layout)
+    except Exception as e:
+        logger.error("Error generating CV PDF: %s", e)
+        raise HTTPException(status_code=500, detail="Erreur lors de la génération du PDF")
+
+    return artifact_response(request, artifact, filename="CV_Ali_Mansouri.pdf")
+
+# Streamed CV endpoint (fresh render, sent from disk in chunks)
+@api_router.get("/generate-cv/stream")
+async def stream_cv(size: str = "a4", layout: str = "full"):
+    if size not in PAGE_SIZES or layout not in LAYOUTS:
+        raise HTTPException(status_code=400, detail="Format de CV inconnu")
+
+    try:
+        rendered = await cv_streamer.render(portfolio_data, pagesize=size, layout=layout)
+    except Exception as e:
+        logger.error("Error generating CV PDF: %s", e)
+        raise HTTPException(status_code=500, detail="Erreur lors de la génération du PDF")
+
+    return StreamingResponse(
+        cv_streamer.iter_file(rendered),
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": "attachment; filename=CV_Ali_Mansouri.pdf",
+            "Content-Length": str(os.fstat(rendered.fileno()).st_size),
+        }
+    )
+
+# Contact message listing order (newest first) and selectable fields
+CONTACT_SORT = [("created_at", -1), ("_id", -1)]
+CONTACT_PAGE_SIZE = 100
+CONTACT_MAX_PAGE_SIZE = 1000
+CONTACT_FIELDS = set(ContactMessageDB.model_fields)
+
+def _contact_query(
+    read: Optional[bool],
+    email: Optional[str],
+    since: Optional[datetime],
+    until: Optional[datetime],
+    archived: Optional[bool] = None,
+) -> dict:
+    query = {}
+    if read is not None:
+        query["read"] = read
+    if archived is not None:
+        # Messages stored before archiving existed have no archived field
+        query["archived"] = True if archived else {"$ne": True}
+    if email:
+        query["email"] = email
+    if since is not None or until is not None:
+        query["created_at"] = {}
+        if since is not None:
+            query["created_at"]["$gte"] = since
+        if until is not None:
+            query["created_at"]["$lt"] = until
+    return query
+
+def _contact_projection(fields: Optional[str]) -> Optional[dict]:
+    if not fields:
+        return None
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested - CONTACT_FIELDS
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Champs inconnus: {', '.join(sorted(unknown))}")
+    # created_at is always returned so the next-page cursor can be built
+    return {field: 1 for field in requested | {"created_at"}}
+
+# Get contact messages (admin endpoint)
 @api_router.get("/contact-messages")
-async def get_contact_messages():
+async def get_contact_messages(
+    request: Request,
+    limit: int = Query(CONTACT_PAGE_SIZE, ge=1, le=CONTACT_MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    read: Optional[bool] = None,
+    email: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    archived: Optional[bool] = None,
+    fields: Optional[str] = None,
+):
+    query = _contact_query(read, email, since, until, archived)
+    projection = _contact_projection(fields)
+    if after:
+        keyset = keyset_filter(decode_cursor(after, CONTACT_SORT), CONTACT_SORT)
+        query = {"$and": [query, keyset]} if query else keyset
+
+    key = cache_key(request)
+    cached = response_cache.get('contact_messages', key)
+    if cached is not None:
+        return Response(content=cached.body, media_type="application/json", headers=cached.headers)
+    generation = response_cache.generation('contact_messages')
+
+    try:
+        messages = await db.contact_messages.find(query, projection).sort(CONTACT_SORT).limit(limit).to_list(limit)
+    except Exception as e:
+        logger.error("Error fetching contact messages: %s", e)
+        raise HTTPException(status_code=500, detail="Erreur lors de la récupération des messages")
+
+    headers = {}
+    if len(messages) == limit:
+        headers["X-Next-Cursor"] = encode_cursor(messages[-1], CONTACT_SORT)
+
+    # ObjectIds and datetimes are encoded natively by the fast JSON path
+    response = FastJSONResponse(messages, headers=headers)
+    response_cache.put('contact_messages', key, response.body, headers, generation)
+    return response
+
+# Contact message counters for the admin badge
+@api_router.get("/contact-messages/count")
+async def count_contact_messages():
     try:
-        messages = await db.contact_messages.find().sort("created_at", -1).to_list(100)
-        # Convert ObjectId to string for JSON serialization
-        for msg in messages:
-            msg['_id'] = str(msg['_id'])
-        return messages
+        # Counters document maintained on insert and on read-state changes
+        return await get_contact_counters(db)
     except Exception as e:
-        logging.error(f"Error fetching contact messages: {str(e)}")
+        logger.error("Error counting contact messages: %s", e)
         raise HTTPException(status_code=500, detail="Erreur lors de la récupération des messages")
 
+# Server-Sent Events feed of new contact messages (admin endpoint)
+@api_router.get("/contact-messages/stream")
+async def stream_contact_messages(
+    last_event_id: Optional[str] = Header(None),
+    after: Optional[str] = Query(None, description="Last-Event-ID for the first connection"),
+):
+    return StreamingResponse(
+        contact_feed.subscribe(db.contact_messages, last_event_id or after),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+# Bulk mark read/unread, archive and delete (admin endpoint)
+@api_router.post("/contact-messages/bulk", response_model=BulkContactResponse)
+async def bulk_contact_messages(request: BulkContactAction):
+    if request.ids:
+        try:
+            query = {"_id": {"$in": [ObjectId(doc_id) for doc_id in request.ids]}}
+        except InvalidId:
+            raise HTTPException(status_code=400, detail="Identifiant invalide")
+    elif request.filter is not None and request.filter.model_dump(exclude_none=True):
+        query = _contact_query(**request.filter.model_dump())
+    else:
+        # An empty selection would touch every message
+        raise HTTPException(status_code=400, detail="ids ou filter requis")
+
+    try:
+        modified = await apply_bulk_action(db, request.action, query, search_backend)
+    except Exception as e:
+        logger.error("Error applying bulk action %s: %s", request.action, e)
+        raise HTTPException(status_code=500, detail="Erreur lors de la mise à jour des messages")
+    finally:
+        # Also after a partial failure, some documents may have changed
+        response_cache.invalidate('contact_messages')
+    return BulkContactResponse(action=request.action, modified=modified)
+
+# Full collection export, streamed in cursor batches (admin endpoint)
+@api_router.get("/export/{collection}")
+async def export_collection(
+    collection: str,
+    format: str = Query("csv", pattern="^(" + "|".join(FORMATS) + ")$"),
+    gzip: bool = False,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    read: Optional[bool] = None,
+    email: Optional[str] = None,
+    client_name: Optional[str] = None,
+):
+    if collection not in EXPORTS:
+        raise HTTPException(status_code=404, detail=f"Collection inconnue: {collection}")
+    query = build_query(collection, since, until, read, email, client_name)
+    try:
+        chunks = export_stream(db, collection, format, query, gzip)
+    except ParquetUnavailable:
+        raise HTTPException(status_code=501, detail="Export Parquet indisponible (pyarrow non installé)")
+
+    filename = export_filename(collection, format, gzip)
+    return StreamingResponse(
+        chunks,
+        media_type="application/gzip" if gzip else MEDIA_TYPES[format],
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+# Liveness: the process is up; reports this worker's pool statistics
+@api_router.get("/healthz")
+async def healthz():
+    return {"status": "ok", "pool": pool_monitor.snapshot()}
+
+# Readiness: MongoDB answers a ping within the server selection timeout
+@api_router.get("/readyz")
+async def readyz():
+    started = time.perf_counter()
+    try:
+        await client.admin.command("ping")
+    except Exception as e:
+        logger.error("MongoDB readiness ping failed: %s", e)
+        return JSONResponse(
+            status_code=503,
+            content={"status": "unavailable", "pool": pool_monitor.snapshot()},
+        )
+    return {
+        "status": "ready",
+        "ping_ms": round((time.perf_counter() - started) * 1000, 3),
+        "pool": pool_monitor.snapshot(),
+    }
+
+# Full-text search over contact messages (admin endpoint)
+@api_router.get("/contact-messages/search")
+async def search_contact_messages(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0, le=1000),
+):
+    try:
+        hits, has_more = await search_backend.search(q, limit, offset)
+    except Exception as e:
+        logger.error("Error searching contact messages: %s", e)
+        raise HTTPException(status_code=500, detail="Erreur lors de la recherche des messages")
+    return FastJSONResponse({"hits": hits, "has_more": has_more, "backend": search_backend.name})
+
 # Include the router in the main app
 app.include_router(api_router)
 
+# PDFs are already compressed; the CV routes also serve byte ranges of the raw file
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=COMPRESSION_MIN_SIZE,
+    skip_prefixes=("/api/download-cv", "/api/generate-cv"),
+)
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
     allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Request-ID"],
 )
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# Outermost middleware so latency covers the whole stack
+app.add_middleware(MetricsMiddleware)
+
+# Request id and access log around everything, including /metrics
+app.add_middleware(RequestContextMiddleware)
+
+# Prometheus scrape endpoint (per worker process)
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return PlainTextResponse(metrics_registry.render(), media_type=METRICS_CONTENT_TYPE)
+
+# Structured logging written by a background thread (LOG_FORMAT=text for the old format)
+log_listener = setup_logging(
+    level=os.environ.get('LOG_LEVEL', 'INFO'),
+    fmt=os.environ.get('LOG_FORMAT', 'json'),
+    access_sample_rate=float(os.environ.get('ACCESS_LOG_SAMPLE_RATE', '0.1')),
 )
 logger = logging.getLogger(__name__)
 
-@app.on_event("shutdown")
-async def shutdown_db_client():
-    client.close()
\ No newline at end of file
+async def _contact_messages_flushed(docs):
+    response_cache.invalidate('contact_messages')
+    for doc in docs:
+        await _index_and_publish(doc)
+    await increment_contact_counters(
+        db, total=len(docs), unread=sum(1 for doc in docs if not doc.get('read'))
+    )
+
+async def _status_checks_flushed(docs):
+    response_cache.invalidate('status_checks')
+    await record_status_checks(db, [(doc['client_name'], doc['timestamp']) for doc in docs])
+
+def start_write_buffers():
+    if not WRITE_BEHIND:
+        return
+    hooks = {
+        'contact_messages': _contact_messages_flushed,
+        'status_checks': _status_checks_flushed,
+    }
+    for name, on_flush in hooks.items():
+        buffer = WriteBehindBuffer(
+            db[name],
+            max_batch=int(os.environ.get('WRITE_BEHIND_BATCH_SIZE', '500')),
+            flush_interval_ms=int(os.environ.get('WRITE_BEHIND_FLUSH_MS', '50')),
+            max_queue=int(os.environ.get('WRITE_BEHIND_QUEUE_SIZE', '10000')),
+            drain_timeout=float(os.environ.get('WRITE_BEHIND_DRAIN_SECONDS', '10')),
+            on_flush=on_flush,
+        )
+        buffer.start()
+        write_buffers[name] = buffer
+
+def precompress_portfolio():
+    payload = portfolio_payloads.get()
+    for encoding in supported_encodings():
+        payload.compressed(encoding)
+
+def prewarm_cv_cache():
+    artifact_dir = Path(os.environ.get('CV_ARTIFACT_DIR', DEFAULT_ARTIFACT_DIR))
+    loaded = cv_render_cache.preload(artifact_dir, portfolio_data)
+    logger.info("Pre-warmed %s CV variants from %s", loaded, artifact_dir)
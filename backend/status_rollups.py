@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Per-client status check counts in minute, hour and day buckets.
+Stored status checks increment the `live` count of each bucket with $inc
+upserts, one per bucket for a whole write-behind batch. Rows stored before rollups existed are counted by a one-off
+aggregation backfill into a separate `backfill` field, so the job is
+idempotent and never races live increments; a bucket's count is the sum.
+
+Usage: python status_rollups.py [--granularity minute|hour|day ...]
+"""
+
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import argparse
+import asyncio
+import logging
+import os
+
+from pymongo import UpdateOne
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_ID = "status_rollups"
+GRANULARITIES = {
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+}
+# Range returned by the stats endpoint when `since` is omitted
+DEFAULT_WINDOWS = {
+    "minute": timedelta(hours=1),
+    "hour": timedelta(days=1),
+    "day": timedelta(days=30),
+}
+# Largest number of buckets a single stats query may span
+MAX_BUCKETS = 10000
+
+# Date parts kept when truncating to each granularity (aggregation pipeline)
+_PARTS = {
+    "minute": ("year", "month", "day", "hour", "minute"),
+    "hour": ("year", "month", "day", "hour"),
+    "day": ("year", "month", "day"),
+}
+_PART_OPERATORS = {"year": "$year", "month": "$month", "day": "$dayOfMonth", "hour": "$hour", "minute": "$minute"}
+
+# Databases whose cutoff this process has recorded
+_cutoff_recorded: Set[str] = set()
+
+
+def _aware(timestamp: datetime) -> datetime:
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.astimezone(timezone.utc)
+
+
+def bucket_start(timestamp: datetime, granularity: str) -> datetime:
+    """UTC start of the bucket containing `timestamp`"""
+    timestamp = _aware(timestamp)
+    if granularity == "minute":
+        return timestamp.replace(second=0, microsecond=0)
+    if granularity == "hour":
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _rollup_id(granularity: str, client_name: str, bucket: datetime) -> dict:
+    return {"g": granularity, "c": client_name, "t": bucket}
+
+
+async def ensure_rollup_cutoff(db, before: Optional[datetime] = None) -> Optional[datetime]:
+    """Record (once) when live rollups started; the backfill covers rows before it
+
+    The cutoff is now, or `before` if that is earlier. Errors are logged and
+    return None so startup does not depend on MongoDB; the first recorded
+    batch retries.
+    """
+    cutoff = datetime.now(timezone.utc)
+    if before is not None:
+        cutoff = min(cutoff, before)
+    try:
+        await db.migrations.update_one(
+            {"_id": ROLLUP_ID}, {"$setOnInsert": {"cutoff": cutoff}}, upsert=True
+        )
+        state = await db.migrations.find_one({"_id": ROLLUP_ID})
+    except Exception as e:
+        logger.error("Error recording the status rollup cutoff: %s", e)
+        return None
+    _cutoff_recorded.add(db.name)
+    return state["cutoff"]
+
+
+async def record_status_checks(db, checks: Iterable[Tuple[str, datetime]]):
+    """Add (client_name, timestamp) pairs to the rollups in one round trip
+
+    Checks falling in the same bucket are summed into a single $inc.
+    """
+    checks = list(checks)
+    if not checks:
+        return
+    if db.name not in _cutoff_recorded:
+        # Startup could not record it: the cutoff must not follow these rows
+        await ensure_rollup_cutoff(db, min(_aware(timestamp) for _, timestamp in checks))
+    counts = Counter(
+        (granularity, client_name, bucket_start(timestamp, granularity))
+        for client_name, timestamp in checks
+        for granularity in GRANULARITIES
+    )
+    await db.status_rollups.bulk_write([
+        UpdateOne(
+            {"_id": _rollup_id(granularity, client_name, bucket)},
+            {
+                "$inc": {"live": count},
+                "$setOnInsert": {"granularity": granularity, "client_name": client_name, "bucket": bucket},
+            },
+            upsert=True,
+        )
+        for (granularity, client_name, bucket), count in counts.items()
+    ], ordered=False)
+
+
+async def query_stats(
+    db,
+    granularity: str,
+    since: datetime,
+    until: datetime,
+    client_name: Optional[str] = None,
+) -> Dict:
+    """Bucket counts in [since, until) from the rollups, with per-client totals"""
+    query = {
+        "granularity": granularity,
+        "bucket": {"$gte": bucket_start(since, granularity), "$lt": until},
+    }
+    if client_name:
+        query["client_name"] = client_name
+    projection = {"_id": 0, "bucket": 1, "client_name": 1, "live": 1, "backfill": 1}
+    cursor = db.status_rollups.find(query, projection).sort([("bucket", 1), ("client_name", 1)])
+
+    buckets: List[dict] = []
+    totals: Dict[str, int] = {}
+    async for doc in cursor:
+        count = doc.get("live", 0) + doc.get("backfill", 0)
+        buckets.append({"bucket": doc["bucket"], "client_name": doc["client_name"], "count": count})
+        totals[doc["client_name"]] = totals.get(doc["client_name"], 0) + count
+    return {"buckets": buckets, "totals": totals}
+
+
+def _backfill_pipeline(granularity: str, cutoff: datetime) -> List[dict]:
+    truncated = {"$dateFromParts": {part: {_PART_OPERATORS[part]: "$ts"} for part in _PARTS[granularity]}}
+    return [
+        # Rows written before live rollups; unmigrated rows still hold ISO strings
+        {"$match": {"$or": [
+            {"timestamp": {"$lt": cutoff}},
+            {"timestamp": {"$type": "string", "$lt": cutoff.isoformat()}},
+        ]}},
+        {"$project": {
+            "client_name": 1,
+            "ts": {"$convert": {"input": "$timestamp", "to": "date", "onError": None, "onNull": None}},
+        }},
+        {"$match": {"ts": {"$ne": None}}},
+        {"$group": {"_id": {"c": "$client_name", "t": truncated}, "backfill": {"$sum": 1}}},
+        {"$project": {
+            "_id": {"g": granularity, "c": "$_id.c", "t": "$_id.t"},
+            "granularity": granularity,
+            "client_name": "$_id.c",
+            "bucket": "$_id.t",
+            "backfill": 1,
+        }},
+        # Only the backfill field is (re)written, live increments are untouched
+        {"$merge": {
+            "into": "status_rollups",
+            "on": "_id",
+            "whenMatched": [{"$set": {"backfill": "$$new.backfill"}}],
+            "whenNotMatched": "insert",
+        }},
+    ]
+
+
+async def backfill_status_rollups(db, granularities=tuple(GRANULARITIES)) -> datetime:
+    """Aggregate pre-cutoff status checks into the rollups (safe to re-run)"""
+    cutoff = await ensure_rollup_cutoff(db)
+    if cutoff is None:
+        raise RuntimeError("Cannot backfill status rollups without a cutoff")
+    for granularity in granularities:
+        await db.status_checks.aggregate(_backfill_pipeline(granularity, cutoff), allowDiskUse=True).to_list(None)
+        logger.info("Backfilled %s status rollups before %s", granularity, cutoff.isoformat())
+    await db.migrations.update_one(
+        {"_id": ROLLUP_ID}, {"$set": {"backfilled_at": datetime.now(timezone.utc)}}
+    )
+    return cutoff
+
+
+async def _main(granularities):
+    from dotenv import load_dotenv
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    load_dotenv(Path(__file__).parent / '.env')
+    client = AsyncIOMotorClient(os.environ['MONGO_URL'], tz_aware=True)
+    try:
+        cutoff = await backfill_status_rollups(client[os.environ['DB_NAME']], granularities)
+        print(f"Backfilled status rollups for rows before {cutoff.isoformat()}")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Build status_checks rollups from existing rows")
+    parser.add_argument("--granularity", action="append", choices=sorted(GRANULARITIES))
+    asyncio.run(_main(tuple(parser.parse_args().granularity or GRANULARITIES)))
@@ -0,0 +1,186 @@
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+import atexit
+import copy
+import logging
+import queue
+import random
+import sys
+import time
+import traceback
+import uuid
+import zlib
+
+import orjson
+
+from metrics import route_template
+
+ACCESS_LOGGER = "access"
+
+# Set per request by RequestContextMiddleware, read when a record is emitted
+_request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+_scope: ContextVar[Optional[dict]] = ContextVar("scope", default=None)
+
+# Attributes every LogRecord has; anything else was passed through `extra=`
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+class ContextFilter(logging.Filter):
+    """Attach the current request id and route template to each record"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "request_id"):
+            record.request_id = _request_id.get()
+        if not hasattr(record, "route"):
+            scope = _scope.get()
+            record.route = route_template(scope) if scope is not None else None
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keep a fraction of INFO-and-below records from high-volume loggers
+
+    Warnings and errors always pass. Sampling is keyed on the request id, so a
+    sampled request keeps all of its info lines.
+    """
+
+    def __init__(self, rate: float, loggers=(ACCESS_LOGGER,)):
+        super().__init__()
+        self.rate = max(0.0, min(rate, 1.0))
+        self.threshold = int(self.rate * 0xFFFFFFFF)
+        self.loggers = set(loggers)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.INFO or record.name not in self.loggers:
+            return True
+        key = getattr(record, "request_id", None)
+        if key is None:
+            return random.random() < self.rate
+        return zlib.crc32(key.encode()) <= self.threshold
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, message, context, extras"""
+
+    converter = time.gmtime
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S") + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and value is not None:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = "".join(traceback.format_exception(*record.exc_info)).rstrip()
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return orjson.dumps(entry, default=str).decode()
+
+
+class _QueueHandler(QueueHandler):
+    """Enqueue records with only the %-merge done on the calling thread
+
+    The stock prepare() formats the whole record (and traceback) before
+    queueing; here formatting and I/O both happen on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class _QueueListener(QueueListener):
+    def stop(self):
+        # Called explicitly and again at exit; the stdlib version fails twice
+        if self._thread is not None:
+            super().stop()
+
+
+def setup_logging(
+    level: str = "INFO",
+    fmt: str = "json",
+    access_sample_rate: float = 1.0,
+    stream=None,
+) -> QueueListener:
+    """Route the root logger through a queue drained by a background thread"""
+    handler = logging.StreamHandler(stream or sys.stderr)
+    if fmt == "json":
+        handler.setFormatter(JSONFormatter())
+    else:
+        handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = _QueueHandler(log_queue)
+    # Context is read on the calling thread, before the record changes threads
+    queue_handler.addFilter(ContextFilter())
+    queue_handler.addFilter(SamplingFilter(access_sample_rate))
+
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    listener = _QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+class RequestContextMiddleware:
+    """Pure ASGI middleware assigning a request id and writing one access record
+
+    The id comes from X-Request-ID when the client sends one and is echoed on
+    the response.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.logger = logging.getLogger(ACCESS_LOGGER)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")[:128]
+                break
+        request_id = request_id or uuid.uuid4().hex
+        id_token = _request_id.set(request_id)
+        scope_token = _scope.set(scope)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message = dict(message, headers=list(message.get("headers", [])) + [
+                    (b"x-request-id", request_id.encode("latin-1"))
+                ])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "%s %s %d", scope["method"], scope["path"], status,
+                    extra={
+                        "method": scope["method"],
+                        "status": status,
+                        "latency_ms": round((time.perf_counter() - started) * 1000, 3),
+                    },
+                )
+            _scope.reset(scope_token)
+            _request_id.reset(id_token)
@@ -0,0 +1,162 @@
+from bson.errors import InvalidDocument, InvalidStringData
+from pymongo.errors import BulkWriteError, ConnectionFailure, ExecutionTimeout, WTimeoutError
+from typing import Awaitable, Callable, List, Optional
+import asyncio
+import logging
+import time
+
+from metrics import Counter, registry
+
+logger = logging.getLogger(__name__)
+
+DUPLICATE_KEY = 11000
+# Failures expected to clear up on their own (logged as warnings when retried)
+TRANSIENT_ERRORS = (ConnectionFailure, ExecutionTimeout, WTimeoutError)
+# Failures caused by the document itself, which no retry can fix: raised while
+# encoding it (too large, unencodable) or reported as a per-document write error
+DOCUMENT_ERRORS = (InvalidDocument, InvalidStringData)
+DOCUMENT_ERROR_CODES = {
+    2,      # BadValue
+    121,    # DocumentValidationFailure
+    10334,  # BSONObjectTooLarge
+    17280,  # KeyTooLong
+}
+MAX_RETRY_DELAY = 30.0
+
+DEAD_LETTERS = registry.register(Counter(
+    "write_behind_dead_letters_total", "Buffered documents rejected permanently by MongoDB", ("collection",)))
+
+
+class WriteBehindBuffer:
+    """Bounded in-process queue flushed to a collection with insert_many
+
+    Documents must carry an app-generated `_id` so a retried batch is
+    idempotent: duplicate-key errors on retry mean the row already landed.
+    Documents rejected for their own content (validation, size, encoding) are
+    logged and dropped so they cannot stall the queue behind them; any other
+    error is retried with exponential backoff, since the API already answered.
+    `put` waits while the queue is full, which applies backpressure to callers.
+    `on_flush` is awaited with the documents of each stored batch (to
+    invalidate read caches, apply counter deltas); its failures are logged.
+    """
+
+    def __init__(
+        self,
+        collection,
+        max_batch: int = 500,
+        flush_interval_ms: int = 50,
+        max_queue: int = 10000,
+        retry_delay: float = 0.5,
+        drain_timeout: float = 10.0,
+        on_flush: Optional[Callable[[List[dict]], Awaitable[None]]] = None,
+    ):
+        self.collection = collection
+        self.on_flush = on_flush
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval_ms / 1000
+        self.retry_delay = retry_delay
+        self.drain_timeout = drain_timeout
+        self._in_flight = 0
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def put(self, doc: dict):
+        if self._closing:
+            raise RuntimeError("Write buffer is shutting down")
+        await self._queue.put(doc)
+
+    async def stop(self):
+        """Stop accepting documents and flush what is queued, for at most drain_timeout"""
+        self._closing = True
+        if self._task is not None:
+            try:
+                await asyncio.wait_for(self._queue.join(), self.drain_timeout)
+            except asyncio.TimeoutError:
+                logger.error(
+                    "Write-behind buffer for %s stopped with %d documents not flushed",
+                    self.collection.name, self._queue.qsize() + self._in_flight,
+                )
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            batch = [await self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.max_batch:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            self._in_flight = len(batch)
+            stored = await self._flush(batch)
+            if self.on_flush is not None and stored:
+                try:
+                    await self.on_flush(stored)
+                except Exception as e:
+                    logger.error("Write-behind flush hook for %s failed: %s", self.collection.name, e)
+            self._in_flight = 0
+            for _ in batch:
+                self._queue.task_done()
+
+    async def _flush(self, batch: List[dict]) -> List[dict]:
+        """Store `batch`, retrying everything but document errors; return the documents stored"""
+        stored = []
+        delay = self.retry_delay
+        while True:
+            try:
+                await self.collection.insert_many(batch, ordered=False)
+                return stored + batch
+            except BulkWriteError as e:
+                # Every document was attempted; duplicates landed on an earlier try
+                errors = {err["index"]: err for err in e.details.get("writeErrors", [])}
+                retry = []
+                for index, doc in enumerate(batch):
+                    err = errors.get(index)
+                    if err is None or err.get("code") == DUPLICATE_KEY:
+                        stored.append(doc)
+                    elif err.get("code") in DOCUMENT_ERROR_CODES:
+                        self._dead_letter(doc, err.get("errmsg"))
+                    else:
+                        retry.append(doc)
+                if not retry:
+                    return stored
+                logger.error(
+                    "Write-behind insert into %s failed for %d documents, retrying",
+                    self.collection.name, len(retry),
+                )
+                batch = retry
+            except DOCUMENT_ERRORS as e:
+                # Refused while encoding: insert one by one so only the
+                # offending documents are dropped
+                if len(batch) == 1:
+                    self._dead_letter(batch[0], e)
+                    return stored
+                for doc in batch:
+                    stored.extend(await self._flush([doc]))
+                return stored
+            except TRANSIENT_ERRORS as e:
+                logger.warning("Write-behind insert into %s failed: %s, retrying", self.collection.name, e)
+            except Exception as e:
+                logger.error("Write-behind insert into %s failed: %s, retrying", self.collection.name, e)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RETRY_DELAY)
+
+    def _dead_letter(self, doc: dict, reason):
+        DEAD_LETTERS.inc((self.collection.name,))
+        logger.error(
+            "Write-behind insert into %s rejected document %s: %s",
+            self.collection.name, doc.get("_id"), reason,
+        )
@@ -6,12 +6,14 @@ Tests all backend endpoints with comprehensive validation
 
 import requests
 import json
+import os
 import sys
 from datetime import datetime
 import io
 
-# Backend URL from frontend environment
-BACKEND_URL = "https://bi-analyst-port.preview.emergentagent.com/api"
+# Backend URL from frontend environment (override with BACKEND_URL for a local server;
+# benchmarks/load_suite.py covers offline load and latency measurements)
+BACKEND_URL = os.environ.get("BACKEND_URL", "https://bi-analyst-port.preview.emergentagent.com/api")
 
 class PortfolioAPITester:
     def __init__(self):
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+CV rendering benchmark: cold vs warm CVGenerator renders
+Cold clears the shared stylesheet and section cache before each render,
+warm reuses them, and "experience edit" changes only one section.
+"""
+
+import copy
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+import cv_generator  # noqa: E402
+from cv_generator import CVGenerator  # noqa: E402
+from portfolio_data import portfolio_data  # noqa: E402
+
+
+def timed(fn, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(label, samples):
+    print(f"{label:<20} median {statistics.median(samples):8.2f} ms   min {min(samples):8.2f} ms")
+
+
+def main(runs=30):
+    def cold():
+        cv_generator.clear_caches()
+        CVGenerator(portfolio_data).generate()
+
+    def warm():
+        CVGenerator(portfolio_data).generate()
+
+    edited = copy.deepcopy(portfolio_data)
+    counter = iter(range(10 ** 9))
+
+    def experience_edit():
+        edited['experience'][0]['endDate'] = f"Edit {next(counter)}"
+        CVGenerator(edited).generate()
+
+    warm()
+    cold_samples = timed(cold, runs)
+    warm()
+    warm_samples = timed(warm, runs)
+    edit_samples = timed(experience_edit, runs)
+
+    report("cold render", cold_samples)
+    report("warm render", warm_samples)
+    report("experience edit", edit_samples)
+    print(f"warm speedup: {statistics.median(cold_samples) / statistics.median(warm_samples):.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 30)
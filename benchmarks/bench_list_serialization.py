@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+List endpoint serialization: FastAPI response_model path vs the fast JSON path
+For growing row counts, compares validating rows against List[StatusCheck] and
+encoding with jsonable_encoder + json.dumps (what FastAPI does for the route)
+with FastJSONResponse's direct orjson encoding of the database rows.
+"""
+
+import json
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "portfolio_bench")
+
+from bson import ObjectId  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+from typing import List  # noqa: E402
+
+from serialization import FastJSONResponse  # noqa: E402
+from server import StatusCheck  # noqa: E402
+
+ROW_COUNTS = (10, 100, 1000, 10000)
+
+
+def status_rows(n):
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    return [{"id": str(uuid.uuid4()), "client_name": f"client-{i % 50}", "timestamp": base + timedelta(seconds=i)}
+            for i in range(n)]
+
+
+def contact_rows(n):
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    return [{"_id": ObjectId(), "name": f"Name {i}", "email": f"user{i}@example.com", "subject": "Hello",
+             "message": "Lorem ipsum dolor sit amet " * 8, "created_at": base + timedelta(seconds=i), "read": False}
+            for i in range(n)]
+
+
+def best_ms(fn, runs=7):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    adapter = TypeAdapter(List[StatusCheck])
+    print(f"{'rows':>7} {'status old':>12} {'status fast':>12} {'contact old':>12} {'contact fast':>13}")
+    for n in ROW_COUNTS:
+        statuses = status_rows(n)
+        contacts = contact_rows(n)
+
+        def status_old():
+            json.dumps(jsonable_encoder(adapter.validate_python(statuses))).encode()
+
+        def contact_old():
+            rows = [dict(row, _id=str(row["_id"])) for row in contacts]
+            JSONResponse(jsonable_encoder(rows))
+
+        results = (
+            best_ms(status_old),
+            best_ms(lambda: FastJSONResponse(statuses)),
+            best_ms(contact_old),
+            best_ms(lambda: FastJSONResponse(contacts)),
+        )
+        print(f"{n:>7} " + " ".join(f"{value:>10.2f}ms" for value in results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Event-loop latency under heavy logging: synchronous handler vs queue listener
+A probe task measures how late a 1 ms sleep wakes up while many tasks log
+errors with request context. The sink sleeps per write to stand in for a slow
+stderr pipe (log shipper, container runtime); --write-delay-ms 0 uses /dev/null.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from structured_logging import ContextFilter, JSONFormatter, setup_logging  # noqa: E402
+
+PROBE_INTERVAL = 0.001
+
+
+class SlowStream:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.sink = open(os.devnull, "w")
+
+    def write(self, data):
+        if self.delay:
+            time.sleep(self.delay)
+        return self.sink.write(data)
+
+    def flush(self):
+        pass
+
+
+def configure(mode: str, stream):
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    if mode == "queue":
+        return setup_logging(stream=stream)
+    # The previous setup: StreamHandler writing on the calling thread
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(JSONFormatter())
+    handler.addFilter(ContextFilter())
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+    return None
+
+
+async def probe(lags, stop):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append((time.perf_counter() - started - PROBE_INTERVAL) * 1000)
+
+
+async def workload(tasks: int, records: int):
+    logger = logging.getLogger("bench")
+    error = RuntimeError("connection reset by peer")
+
+    async def worker(n):
+        for i in range(records):
+            logger.error("Error fetching contact messages: %s", error, extra={"worker": n, "i": i})
+            await asyncio.sleep(0)
+
+    lags = []
+    stop = asyncio.Event()
+    probe_task = asyncio.create_task(probe(lags, stop))
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(n) for n in range(tasks)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe_task
+    return elapsed, lags
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=50)
+    parser.add_argument("--records", type=int, default=100)
+    parser.add_argument("--write-delay-ms", type=float, default=0.1)
+    args = parser.parse_args()
+
+    print(f"{args.tasks * args.records} records, sink write delay {args.write_delay_ms} ms")
+    print(f"{'handler':>8} {'loop time':>10} {'lag p50':>9} {'lag p99':>9} {'lag max':>9}")
+    for mode in ("sync", "queue"):
+        listener = configure(mode, SlowStream(args.write_delay_ms / 1000))
+        elapsed, lags = asyncio.run(workload(args.tasks, args.records))
+        if listener is not None:
+            listener.stop()
+        lags.sort()
+        p99 = lags[min(len(lags) - 1, int(len(lags) * 0.99))]
+        print(f"{mode:>8} {elapsed * 1000:>8.1f}ms {statistics.median(lags):>7.2f}ms {p99:>7.2f}ms {lags[-1]:>7.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
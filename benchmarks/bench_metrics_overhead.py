@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+MetricsMiddleware overhead microbenchmark
+Drives a minimal FastAPI route through the ASGI interface directly (no socket),
+with and without the middleware, and reports the per-request cost it adds.
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from fastapi import FastAPI  # noqa: E402
+from metrics import MetricsMiddleware  # noqa: E402
+
+
+def build_app(with_metrics):
+    app = FastAPI()
+
+    @app.get("/api/ping/{item}")
+    async def ping(item: str):
+        return {"item": item}
+
+    if with_metrics:
+        app.add_middleware(MetricsMiddleware)
+    return app
+
+
+async def drive(app, requests):
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": "/api/ping/abc", "raw_path": b"/api/ping/abc", "root_path": "",
+        "query_string": b"", "headers": [], "client": ("127.0.0.1", 1234), "server": ("test", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+async def main(requests, rounds=5):
+    plain, instrumented = build_app(False), build_app(True)
+    await drive(plain, 1000)
+    await drive(instrumented, 1000)
+    base = statistics.median([await drive(plain, requests) for _ in range(rounds)])
+    with_metrics = statistics.median([await drive(instrumented, requests) for _ in range(rounds)])
+    print(f"without middleware {base:8.2f} us/request")
+    print(f"with middleware    {with_metrics:8.2f} us/request")
+    print(f"overhead           {with_metrics - base:8.2f} us/request ({(with_metrics / base - 1) * 100:.1f}%)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000))
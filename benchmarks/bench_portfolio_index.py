@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Technology lookups: PortfolioIndex vs scanning portfolio_data on every request
+Builds synthetic portfolios with thousands of projects and roles, then compares
+the index build time and per-lookup latency with a linear scan that normalizes
+every tool, skill and responsibility for each query.
+"""
+
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from portfolio_index import ALIASES, PortfolioIndex, normalize  # noqa: E402
+
+SIZES = (100, 1000, 10000)
+LOOKUPS = 2000
+TOOLS = list(ALIASES) + [f"Tool {i}" for i in range(200)]
+
+
+def synthetic_portfolio(n, seed=0):
+    rng = random.Random(seed)
+
+    def pick(k):
+        return rng.sample(TOOLS, k)
+
+    return {
+        "projects": [{"id": i, "name": f"Project {i}", "tools": pick(4)} for i in range(n)],
+        "experience": [
+            {"id": i, "role": f"Role {i}", "company": f"Company {i % 97}",
+             "responsibilities": [f"Développement avec {a} et {b}" for a, b in zip(pick(3), pick(3))]}
+            for i in range(n)
+        ],
+        "skills": {
+            f"category{i}": {"title": f"Category {i}", "items": pick(6)} for i in range(max(n // 10, 1))
+        },
+    }
+
+
+def scan(data, tool):
+    key = normalize(tool)
+    projects = sum(any(normalize(t) == key for t in p["tools"]) for p in data["projects"])
+    roles = sum(any(key in normalize(r) for r in e["responsibilities"]) for e in data["experience"])
+    skills = sum(any(normalize(t) == key for t in c["items"]) for c in data["skills"].values())
+    return projects, roles, skills
+
+
+def per_call_us(fn, queries):
+    start = time.perf_counter()
+    for query in queries:
+        fn(query)
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+
+def main():
+    rng = random.Random(1)
+    queries = [rng.choice(TOOLS + ["MS Power BI", "sklearn", "Unknown"]) for _ in range(LOOKUPS)]
+    print(f"{'entries':>8} {'build':>10} {'index lookup':>14} {'linear scan':>13}")
+    for n in SIZES:
+        data = synthetic_portfolio(n)
+        builds = []
+        for _ in range(3):
+            start = time.perf_counter()
+            index = PortfolioIndex(data)
+            builds.append((time.perf_counter() - start) * 1000)
+        lookup = per_call_us(index.lookup, queries)
+        linear = per_call_us(lambda q: scan(data, q), queries[:max(LOOKUPS * 100 // n, 20)])
+        print(f"{n:>8} {statistics.median(builds):>8.1f}ms {lookup:>12.2f}us {linear:>11.0f}us")
+
+
+if __name__ == "__main__":
+    main()
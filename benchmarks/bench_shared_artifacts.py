@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+CV artifact memory across worker processes: private bytes vs shared mapping
+N processes each load the same artifact and hash it (as the ETag does), then
+report their proportional set size (Pss, Linux) growth while all are alive.
+Private copies cost N x size; the mapped store copy costs about one in total.
+Also checks that N processes asking for the same render produce it once.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from artifacts import Artifact, ArtifactStore, MirroredFile  # noqa: E402
+from cv_cache import CVRenderCache  # noqa: E402
+from portfolio_data import portfolio_data  # noqa: E402
+
+
+def pss_kb() -> int:
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            if line.startswith("Pss:"):
+                return int(line.split()[1])
+    return 0
+
+
+def load_worker(mode, path, loaded, done, results):
+    before = pss_kb()
+    if mode == "private":
+        artifact = Artifact(Path(path).read_bytes(), 0)
+    else:
+        # The path download-cv serves: a mapped copy published to the store
+        artifact = MirroredFile(path, ArtifactStore(Path(path).parent / "shared")).get()
+    loaded.wait()
+    results.put(pss_kb() - before)
+    done.wait()
+    del artifact
+
+
+def render_worker(directory, start, results):
+    cache = CVRenderCache(store=ArtifactStore(directory))
+    renders = 0
+    render_bytes = cache._render_bytes
+
+    async def counted(*args):
+        nonlocal renders
+        renders += 1
+        return await render_bytes(*args)
+
+    cache._render_bytes = counted
+    start.wait()
+    asyncio.run(cache.get(portfolio_data, "a4", "condensed"))
+    cache.shutdown()
+    results.put(renders)
+
+
+def measure_memory(mode, path, workers):
+    loaded = multiprocessing.Barrier(workers)
+    done = multiprocessing.Barrier(workers + 1)
+    results = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=load_worker, args=(mode, path, loaded, done, results))
+                 for _ in range(workers)]
+    for process in processes:
+        process.start()
+    total = sum(results.get() for _ in processes)
+    done.wait()
+    for process in processes:
+        process.join()
+    return total / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--size-mb", type=int, default=32)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "artifact.pdf"
+        path.write_bytes(os.urandom(args.size_mb * 1024 * 1024))
+        print(f"{args.workers} workers, {args.size_mb} MB artifact")
+        for mode in ("private", "mapped"):
+            print(f"  {mode:>8}: Pss growth {measure_memory(mode, path, args.workers):8.1f} MB total")
+
+        start = multiprocessing.Barrier(args.workers)
+        results = multiprocessing.Queue()
+        processes = [multiprocessing.Process(target=render_worker, args=(directory, start, results))
+                     for _ in range(args.workers)]
+        started = time.perf_counter()
+        for process in processes:
+            process.start()
+        renders = sum(results.get() for _ in processes)
+        for process in processes:
+            process.join()
+        print(f"  concurrent render requests: {renders} render(s) for {args.workers} workers "
+              f"in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
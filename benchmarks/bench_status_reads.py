@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+status_checks read throughput: ISO string timestamps vs native BSON datetimes
+Seeds a scratch database, times the GET /api/status read path (fetch + parse),
+runs the timestamp migration and times it again.
+
+Usage: MONGO_URL=mongodb://localhost:27017 python benchmarks/bench_status_reads.py [rows]
+"""
+
+import asyncio
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from motor.motor_asyncio import AsyncIOMotorClient  # noqa: E402
+from migrate_timestamps import migrate_status_timestamps, parse_timestamp  # noqa: E402
+
+BENCH_DB = "bench_status_reads"
+
+
+async def read_all(db):
+    rows = 0
+    async for check in db.status_checks.find({}, {"_id": 0}).sort([("timestamp", 1), ("id", 1)]).batch_size(1000):
+        if isinstance(check["timestamp"], str):
+            check["timestamp"] = parse_timestamp(check["timestamp"])
+        rows += 1
+    return rows
+
+
+async def measure(db, label, runs=5):
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        rows = await read_all(db)
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<18} {rows} rows in {best * 1000:8.1f} ms  ({rows / best:,.0f} rows/s)")
+    return rows / best
+
+
+async def main(rows):
+    client = AsyncIOMotorClient(os.environ.get("MONGO_URL", "mongodb://localhost:27017"), tz_aware=True)
+    await client.drop_database(BENCH_DB)
+    db = client[BENCH_DB]
+    try:
+        base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        await db.status_checks.insert_many([
+            {"id": str(uuid.uuid4()), "client_name": f"client-{i % 50}",
+             "timestamp": (base + timedelta(seconds=i)).isoformat()}
+            for i in range(rows)
+        ])
+        await db.status_checks.create_index([("timestamp", 1), ("id", 1)])
+
+        before = await measure(db, "string timestamps")
+        start = time.perf_counter()
+        await migrate_status_timestamps(db, batch_size=1000)
+        print(f"{'migration':<18} {time.perf_counter() - start:.2f}s")
+        after = await measure(db, "BSON datetimes")
+        print(f"read throughput: {after / before:.2f}x")
+    finally:
+        await client.drop_database(BENCH_DB)
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000))
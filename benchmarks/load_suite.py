@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Local load/benchmark suite for the portfolio API
+Runs the FastAPI app in-process (httpx ASGI transport) against mongomock-motor,
+or a running server with --url, drives concurrent load at every endpoint and
+reports throughput and p50/p95/p99 latency. Results are saved as JSON; with
+--baseline a run fails (exit 1) when an endpoint regresses beyond --tolerance.
+
+Usage:
+  python benchmarks/load_suite.py --out bench.json
+  python benchmarks/load_suite.py --baseline bench.json --tolerance 0.25
+  python benchmarks/load_suite.py --url http://localhost:8001 --requests 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from itertools import count
+from pathlib import Path
+
+import httpx
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+
+_seq = count()
+
+
+def contact_payload():
+    n = next(_seq)
+    return {
+        "name": f"Bench {n}",
+        "email": f"bench{n}@example.com",
+        "subject": "Load test",
+        "message": "Benchmark message body used to exercise the contact endpoint.",
+    }
+
+
+# name -> (method, path, json body factory or None)
+SCENARIOS = {
+    "root": ("GET", "/api/", None),
+    "status_create": ("POST", "/api/status", lambda: {"client_name": f"bench-{next(_seq) % 50}"}),
+    "status_list": ("GET", "/api/status?limit=100", None),
+    "status_ndjson": ("GET", "/api/status?format=ndjson&limit=500", None),
+    "status_stats": ("GET", "/api/status/stats?granularity=hour", None),
+    "portfolio": ("GET", "/api/portfolio", None),
+    "portfolio_sections": ("GET", "/api/portfolio?sections=skills", None),
+    "portfolio_search": ("GET", "/api/portfolio/search?tool=python", None),
+    "contact_submit": ("POST", "/api/contact", contact_payload),
+    "contact_list": ("GET", "/api/contact-messages?limit=100", None),
+    "contact_count": ("GET", "/api/contact-messages/count", None),
+    "contact_search": ("GET", "/api/contact-messages/search?q=benchmark&limit=20", None),
+    "export_contacts_csv": ("GET", "/api/export/contact_messages?format=csv", None),
+    "export_status_ndjson": ("GET", "/api/export/status_checks?format=ndjson&gzip=true", None),
+    "download_cv": ("GET", "/api/download-cv", None),
+    "generate_cv": ("GET", "/api/generate-cv", None),
+    "healthz": ("GET", "/api/healthz", None),
+    "readyz": ("GET", "/api/readyz", None),
+    "metrics": ("GET", "/metrics", None),
+}
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+async def run_scenario(client, name, requests, concurrency):
+    method, path, body = SCENARIOS[name]
+    latencies = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, path, json=body() if body else None)
+                await response.aread()
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "errors": errors,
+        "rps": round(requests / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+    }
+
+
+async def seed(client, rows):
+    for _ in range(rows):
+        await client.post("/api/status", json=SCENARIOS["status_create"][2]())
+        await client.post("/api/contact", json=contact_payload())
+
+
+def in_process_app():
+    """Import the app with a mongomock-motor client and permissive rate limits"""
+    os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    os.environ.setdefault("DB_NAME", "portfolio_bench")
+    os.environ.setdefault("CONTACT_IP_BURST", "1000000000")
+    os.environ.setdefault("CONTACT_EMAIL_BURST", "1000000000")
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    from mongomock_motor import AsyncMongoMockClient
+    import server
+
+    mock_client = AsyncMongoMockClient(tz_aware=True)
+    server.create_client = lambda mongo_url, pool_monitor: mock_client
+    return server.app
+
+
+async def run(args):
+    results = {}
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url.rstrip("/"), timeout=30)
+        lifespan = None
+    else:
+        app = in_process_app()
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=30)
+        lifespan = app.router.lifespan_context(app)
+        await lifespan.__aenter__()
+
+    try:
+        await seed(client, args.seed)
+        for name in args.scenarios or SCENARIOS:
+            await run_scenario(client, name, min(args.requests, 20), args.concurrency)
+            results[name] = await run_scenario(client, name, args.requests, args.concurrency)
+            r = results[name]
+            print(f"{name:<22} {r['rps']:>9.1f} req/s  p50 {r['p50_ms']:8.2f}  p95 {r['p95_ms']:8.2f}  "
+                  f"p99 {r['p99_ms']:8.2f} ms  errors {r['errors']}")
+    finally:
+        await client.aclose()
+        if lifespan is not None:
+            await lifespan.__aexit__(None, None, None)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Return a list of regression descriptions against a previous run"""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None:
+            continue
+        if current["p95_ms"] > previous["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {previous['p95_ms']} -> {current['p95_ms']} ms")
+        if current["rps"] < previous["rps"] * (1 - tolerance):
+            regressions.append(f"{name}: throughput {previous['rps']} -> {current['rps']} req/s")
+        if current["errors"] > previous["errors"]:
+            regressions.append(f"{name}: errors {previous['errors']} -> {current['errors']}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent load benchmark for the portfolio API")
+    parser.add_argument("--url", help="benchmark a running server instead of the in-process app")
+    parser.add_argument("--requests", type=int, default=500, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--seed", type=int, default=200, help="status checks and messages inserted first")
+    parser.add_argument("--scenarios", nargs="*", choices=sorted(SCENARIOS), help="subset of scenarios to run")
+    parser.add_argument("--out", type=Path, help="write results JSON here")
+    parser.add_argument("--baseline", type=Path, help="previous results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative regression")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "target": args.url or "in-process",
+        "python": platform.python_version(),
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "results": results,
+    }
+    if args.out:
+        args.out.write_text(json.dumps(report, indent=2))
+        print(f"Results written to {args.out}")
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regression beyond {args.tolerance:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import React from "react";
 import "./App.css";
 import { ThemeProvider } from './context/ThemeContext';
+import { PortfolioGate, PortfolioProvider } from './context/PortfolioContext';
 import Header from './components/Header';
 import Hero from './components/Hero';
 import About from './components/About';
@@ -16,15 +17,20 @@ function App() {
     <ThemeProvider>
       <div className="App min-h-screen bg-background text-foreground">
         <Header />
-        <main>
-          <Hero />
-          <About />
-          <Experience />
-          <Projects />
-          <Skills />
-          <Contact />
-        </main>
-        <Footer />
+        <PortfolioProvider>
+          <main>
+            <PortfolioGate>
+              <Hero />
+              <About />
+              <Experience />
+              <Projects />
+              <Skills />
+            </PortfolioGate>
+            {/* Posts to the API on its own, so it works without the portfolio data */}
+            <Contact />
+          </main>
+          <Footer />
+        </PortfolioProvider>
         <Toaster />
       </div>
     </ThemeProvider>
@@ -3,10 +3,10 @@ import { GraduationCap, Award, Globe, Trophy } from 'lucide-react';
 import { Card, CardContent, CardHeader, CardTitle } from './ui/card';
 import { Badge } from './ui/badge';
 import { Tabs, TabsContent, TabsList, TabsTrigger } from './ui/tabs';
-import { portfolioData } from '../mockData';
+import { usePortfolio } from '../context/PortfolioContext';
 
 const About = () => {
-  const { education, certifications, languages, activities } = portfolioData;
+  const { education, certifications, languages, activities } = usePortfolio();
   const sectionRef = useRef(null);
 
   useEffect(() => {
@@ -1,10 +1,10 @@
 import React, { useEffect, useRef } from 'react';
 import { Briefcase, Calendar, MapPin } from 'lucide-react';
 import { Card, CardContent, CardHeader, CardTitle } from './ui/card';
-import { portfolioData } from '../mockData';
+import { usePortfolio } from '../context/PortfolioContext';
 
 const Experience = () => {
-  const { experience } = portfolioData;
+  const { experience } = usePortfolio();
   const sectionRef = useRef(null);
 
   useEffect(() => {
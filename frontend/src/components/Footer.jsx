@@ -1,9 +1,10 @@
 import React from 'react';
 import { Github, Linkedin, Mail, Heart } from 'lucide-react';
-import { portfolioData } from '../mockData';
+import { usePortfolioState } from '../context/PortfolioContext';
 
 const Footer = () => {
-  const { personal } = portfolioData;
+  // Contact links appear once the portfolio data has loaded
+  const personal = usePortfolioState().data?.personal;
   const currentYear = new Date().getFullYear();
 
   return (
@@ -49,33 +50,35 @@ const Footer = () => {
             <h4 className="text-sm font-semibold text-foreground uppercase tracking-wider">
               Restons connectés
             </h4>
-            <div className="space-y-2 text-sm">
-              <a
-                href={`mailto:${personal.email}`}
-                className="flex items-center gap-2 text-foreground/60 hover:text-primary transition-colors"
-              >
-                <Mail size={16} />
-                {personal.email}
-              </a>
-              <div className="flex gap-3 pt-2">
+            {personal && (
+              <div className="space-y-2 text-sm">
                 <a
-                  href={personal.linkedin}
-                  target="_blank"
-                  rel="noopener noreferrer"
-                  className="p-2 rounded border border-border hover:border-primary hover:text-primary transition-all"
+                  href={`mailto:${personal.email}`}
+                  className="flex items-center gap-2 text-foreground/60 hover:text-primary transition-colors"
                 >
-                  <Linkedin size={18} />
-                </a>
-                <a
-                  href={personal.github}
-                  target="_blank"
-                  rel="noopener noreferrer"
-                  className="p-2 rounded border border-border hover:border-primary hover:text-primary transition-all"
-                >
-                  <Github size={18} />
+                  <Mail size={16} />
+                  {personal.email}
                 </a>
+                <div className="flex gap-3 pt-2">
+                  <a
+                    href={personal.linkedin}
+                    target="_blank"
+                    rel="noopener noreferrer"
+                    className="p-2 rounded border border-border hover:border-primary hover:text-primary transition-all"
+                  >
+                    <Linkedin size={18} />
+                  </a>
+                  <a
+                    href={personal.github}
+                    target="_blank"
+                    rel="noopener noreferrer"
+                    className="p-2 rounded border border-border hover:border-primary hover:text-primary transition-all"
+                  >
+                    <Github size={18} />
+                  </a>
+                </div>
               </div>
-            </div>
+            )}
           </div>
         </div>
 
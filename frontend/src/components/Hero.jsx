@@ -1,12 +1,12 @@
 import React, { useEffect, useRef } from 'react';
 import { Github, Linkedin, Mail, MapPin, Download } from 'lucide-react';
 import { Button } from './ui/button';
-import { portfolioData } from '../mockData';
+import { usePortfolio } from '../context/PortfolioContext';
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 
 const Hero = () => {
-  const { personal } = portfolioData;
+  const { personal } = usePortfolio();
   const titleRef = useRef(null);
 
   useEffect(() => {
@@ -30,7 +30,8 @@ const Hero = () => {
 
   const handleDownloadCV = async () => {
     try {
-      const response = await fetch(`${BACKEND_URL}/api/download-cv`);
+      // Revalidate with the cached ETag instead of re-downloading the PDF
+      const response = await fetch(`${BACKEND_URL}/api/download-cv`, { cache: 'no-cache' });
       const blob = await response.blob();
       const url = window.URL.createObjectURL(blob);
       const link = document.createElement('a');
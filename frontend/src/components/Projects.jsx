@@ -1,10 +1,10 @@
 import React, { useEffect, useRef } from 'react';
 import { Card, CardContent, CardHeader, CardTitle, CardDescription } from './ui/card';
 import { Badge } from './ui/badge';
-import { portfolioData } from '../mockData';
+import { usePortfolio } from '../context/PortfolioContext';
 
 const Projects = () => {
-  const { projects } = portfolioData;
+  const { projects } = usePortfolio();
   const sectionRef = useRef(null);
 
   useEffect(() => {
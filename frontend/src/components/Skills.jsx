@@ -1,9 +1,9 @@
 import React, { useEffect, useRef } from 'react';
 import { Card, CardContent, CardHeader, CardTitle } from './ui/card';
-import { portfolioData } from '../mockData';
+import { usePortfolio } from '../context/PortfolioContext';
 
 const Skills = () => {
-  const { skills } = portfolioData;
+  const { skills } = usePortfolio();
   const sectionRef = useRef(null);
 
   useEffect(() => {
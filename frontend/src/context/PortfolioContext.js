@@ -0,0 +1,95 @@
+import React, { createContext, useCallback, useContext, useEffect, useState } from 'react';
+import { Loader2, RefreshCw } from 'lucide-react';
+import { Button } from '../components/ui/button';
+
+const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
+
+const PortfolioContext = createContext(null);
+
+// { data, error, retry }: data is null until the portfolio has loaded
+export const usePortfolioState = () => {
+  const context = useContext(PortfolioContext);
+  if (!context) {
+    throw new Error('usePortfolioState must be used within PortfolioProvider');
+  }
+  return context;
+};
+
+export const usePortfolio = () => {
+  const { data } = usePortfolioState();
+  if (!data) {
+    throw new Error('usePortfolio must be used within PortfolioGate');
+  }
+  return data;
+};
+
+export const PortfolioProvider = ({ children }) => {
+  const [data, setData] = useState(null);
+  const [error, setError] = useState(null);
+  const [attempt, setAttempt] = useState(0);
+
+  useEffect(() => {
+    let cancelled = false;
+    setError(null);
+    // Served with an ETag and cache headers, so repeat visits hit the HTTP cache
+    fetch(`${BACKEND_URL}/api/portfolio`)
+      .then((response) => {
+        if (!response.ok) {
+          throw new Error(`HTTP ${response.status}`);
+        }
+        return response.json();
+      })
+      .then((portfolio) => {
+        if (!cancelled) {
+          setData(portfolio);
+        }
+      })
+      .catch((err) => {
+        console.error('Erreur lors du chargement du portfolio:', err);
+        if (!cancelled) {
+          setError(err);
+        }
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [attempt]);
+
+  const retry = useCallback(() => setAttempt((n) => n + 1), []);
+
+  return (
+    <PortfolioContext.Provider value={{ data, error, retry }}>
+      {children}
+    </PortfolioContext.Provider>
+  );
+};
+
+// Renders its children once the data has arrived, a loading or retry state before
+export const PortfolioGate = ({ children }) => {
+  const { data, error, retry } = usePortfolioState();
+
+  if (data) {
+    return children;
+  }
+
+  return (
+    <section className="min-h-screen flex items-center justify-center px-4">
+      {error ? (
+        <div className="text-center space-y-4" role="alert">
+          <p className="text-foreground/60">
+            Impossible de charger le portfolio pour le moment.
+          </p>
+          <Button variant="outline" onClick={retry}>
+            <RefreshCw className="mr-2" size={16} />
+            Réessayer
+          </Button>
+        </div>
+      ) : (
+        <div className="flex items-center gap-3 text-foreground/60" role="status">
+          <Loader2 className="animate-spin" size={20} />
+          Chargement du portfolio…
+        </div>
+      )}
+    </section>
+  );
+};
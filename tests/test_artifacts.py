@@ -0,0 +1,113 @@
+from email.utils import formatdate
+
+import pytest
+from starlette.requests import Request
+
+from artifacts import Artifact, _not_modified, _parse_range, _RangeNotSatisfiable, artifact_response
+
+CONTENT = bytes(range(100))
+MTIME = 1_700_000_000
+
+
+@pytest.fixture
+def artifact():
+    return Artifact(CONTENT, MTIME)
+
+
+def make_request(headers=None, method="GET"):
+    raw = [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()]
+    return Request({"type": "http", "method": method, "path": "/api/download-cv", "headers": raw})
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("bytes=0-9", (0, 9)),
+        ("bytes=10-", (10, 99)),
+        ("bytes=-10", (90, 99)),
+        ("bytes=-500", (0, 99)),
+        ("bytes=90-500", (90, 99)),
+        ("bytes=99-99", (99, 99)),
+        ("BYTES = 5-6", (5, 6)),
+        # Ignored: served in full with 200
+        ("bytes=0-1,5-6", None),
+        ("items=0-1", None),
+        ("bytes=abc", None),
+        ("bytes=a-b", None),
+        ("bytes=5-3", None),
+        ("bytes=-", None),
+        ("bytes=--5", None),
+        ("bytes=+1-2", None),
+        ("bytes=5", None),
+        ("bytes=", None),
+    ],
+)
+def test_parse_range(header, expected):
+    assert _parse_range(header, len(CONTENT)) == expected
+
+
+@pytest.mark.parametrize("header", ["bytes=100-", "bytes=100-200", "bytes=-0"])
+def test_parse_range_unsatisfiable(header):
+    with pytest.raises(_RangeNotSatisfiable):
+        _parse_range(header, len(CONTENT))
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        ({}, False),
+        ({"If-None-Match": "*"}, True),
+        ({"If-None-Match": "ETAG"}, True),
+        ({"If-None-Match": "W/ETAG"}, True),
+        ({"If-None-Match": '"other", ETAG'}, True),
+        ({"If-None-Match": '"other"'}, False),
+        ({"If-Modified-Since": formatdate(MTIME, usegmt=True)}, True),
+        ({"If-Modified-Since": formatdate(MTIME + 60, usegmt=True)}, True),
+        ({"If-Modified-Since": formatdate(MTIME - 60, usegmt=True)}, False),
+        ({"If-Modified-Since": "yesterday"}, False),
+        # If-None-Match takes precedence over If-Modified-Since
+        ({"If-None-Match": '"other"', "If-Modified-Since": formatdate(MTIME, usegmt=True)}, False),
+    ],
+)
+def test_not_modified(artifact, headers, expected):
+    headers = {name: value.replace("ETAG", artifact.etag) for name, value in headers.items()}
+    assert _not_modified(make_request(headers), artifact) is expected
+
+
+@pytest.mark.parametrize(
+    "headers, status, body",
+    [
+        ({}, 200, CONTENT),
+        ({"Range": "bytes=0-9"}, 206, CONTENT[:10]),
+        ({"Range": "bytes=-5"}, 206, CONTENT[-5:]),
+        ({"Range": "bytes=95-"}, 206, CONTENT[95:]),
+        ({"Range": "bytes=0-1,5-6"}, 200, CONTENT),
+        ({"Range": "bytes=abc"}, 200, CONTENT),
+        ({"Range": "bytes=5-3"}, 200, CONTENT),
+        ({"Range": "bytes=200-"}, 416, b""),
+        ({"Range": "bytes=0-9", "If-Range": "ETAG"}, 206, CONTENT[:10]),
+        ({"Range": "bytes=0-9", "If-Range": '"stale"'}, 200, CONTENT),
+        ({"Range": "bytes=0-9", "If-Range": "W/ETAG"}, 200, CONTENT),
+        ({"If-None-Match": "ETAG", "Range": "bytes=0-9"}, 304, b""),
+    ],
+)
+def test_artifact_response(artifact, headers, status, body):
+    headers = {name: value.replace("ETAG", artifact.etag) for name, value in headers.items()}
+
+    response = artifact_response(make_request(headers), artifact, "cv.pdf")
+
+    assert response.status_code == status
+    assert bytes(response.body) == body
+    if status == 206:
+        start = CONTENT.index(body[0])
+        assert response.headers["content-range"] == f"bytes {start}-{start + len(body) - 1}/100"
+    if status == 416:
+        assert response.headers["content-range"] == "bytes */100"
+
+
+def test_head_reports_length_without_body(artifact):
+    response = artifact_response(make_request({"Range": "bytes=0-9"}, method="HEAD"), artifact, "cv.pdf")
+
+    assert response.status_code == 206
+    assert response.headers["content-length"] == "10"
+    assert response.body == b""
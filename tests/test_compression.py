@@ -0,0 +1,58 @@
+import asyncio
+import gzip
+
+import pytest
+
+from compression import CompressionMiddleware
+
+
+def make_app(body: bytes, headers):
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+    return app
+
+
+def call(app, accept=b"gzip"):
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/api/portfolio", "headers": [(b"accept-encoding", accept)]}
+    asyncio.run(CompressionMiddleware(app, minimum_size=100)(scope, receive, send))
+    start, body = messages[0], b"".join(m.get("body", b"") for m in messages[1:])
+    return dict(start["headers"]), [v for n, v in start["headers"] if n == b"vary"], body
+
+
+@pytest.mark.parametrize("body", [b"small", b"x" * 1000])
+@pytest.mark.parametrize(
+    "vary, expected",
+    [
+        ([], b"Accept-Encoding"),
+        ([b"Accept-Encoding"], b"Accept-Encoding"),
+        ([b"accept-encoding"], b"accept-encoding"),
+        ([b"Origin, Accept-Encoding"], b"Origin, Accept-Encoding"),
+        ([b"Origin"], b"Origin, Accept-Encoding"),
+        ([b"Origin", b"Cookie"], b"Origin, Cookie, Accept-Encoding"),
+        ([b"*"], b"*"),
+    ],
+)
+def test_vary_lists_accept_encoding_once(body, vary, expected):
+    headers = [(b"content-type", b"application/json")] + [(b"vary", value) for value in vary]
+
+    _, sent_vary, _ = call(make_app(body, headers))
+
+    assert sent_vary == [expected]
+
+
+def test_large_body_is_compressed():
+    body = b'{"a": 1}' * 200
+    headers, _, sent = call(make_app(body, [(b"content-type", b"application/json")]))
+
+    assert headers[b"content-encoding"] == b"gzip"
+    assert headers[b"content-length"] == str(len(sent)).encode()
+    assert gzip.decompress(sent) == body
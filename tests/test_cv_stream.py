@@ -0,0 +1,85 @@
+import asyncio
+import glob
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from reportlab import rl_config
+
+from cv_generator import CVGenerator
+from cv_stream import CVStreamer
+from portfolio_data import portfolio_data
+
+
+@pytest.fixture(autouse=True)
+def invariant_pdfs(monkeypatch):
+    # Fixed creation date and document id so two renders are byte-identical
+    monkeypatch.setattr(rl_config, "invariant", 1)
+
+
+@pytest.fixture
+def executor():
+    # Threads share the invariant setting; the server uses the render process pool
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        yield pool
+
+
+def _leftover_files():
+    return glob.glob(os.path.join(tempfile.gettempdir(), "cv-stream-*"))
+
+
+async def _read(streamer, delay=0):
+    rendered = await streamer.render(portfolio_data)
+    chunks = []
+    async for chunk in streamer.iter_file(rendered):
+        chunks.append(chunk)
+        await asyncio.sleep(delay)
+    return chunks
+
+
+def test_stream_matches_generate(executor):
+    expected = CVGenerator(portfolio_data).generate().getvalue()
+    streamer = CVStreamer(lambda: executor, chunk_size=256)
+
+    chunks = asyncio.run(_read(streamer))
+
+    assert b"".join(chunks) == expected
+    assert max(len(chunk) for chunk in chunks) == 256
+    assert not _leftover_files()
+
+
+def test_concurrent_slow_consumers(executor):
+    expected = CVGenerator(portfolio_data).generate().getvalue()
+    streamer = CVStreamer(lambda: executor, max_concurrent=2, chunk_size=1024)
+
+    async def main():
+        return await asyncio.gather(*(_read(streamer, 0.001) for _ in range(4)))
+
+    for chunks in asyncio.run(main()):
+        assert b"".join(chunks) == expected
+    assert not _leftover_files()
+
+
+def test_abandoned_streams_leave_no_file(executor):
+    streamer = CVStreamer(lambda: executor, chunk_size=256)
+
+    async def main():
+        # Rendered but never streamed
+        (await streamer.render(portfolio_data)).close()
+        # Consumer disconnects after the first chunk
+        stream = streamer.iter_file(await streamer.render(portfolio_data))
+        await stream.__anext__()
+        await stream.aclose()
+        # Cancelled while the render is still running
+        task = asyncio.ensure_future(streamer.render(portfolio_data))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # The file is removed by a loop callback once the worker finishes
+        await asyncio.to_thread(executor.shutdown, True)
+        await asyncio.sleep(0)
+
+    asyncio.run(main())
+    assert not _leftover_files()
@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+import idempotency
+from idempotency import IdempotencyConflict, IdempotencyStore
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(idempotency.time, "monotonic", clock)
+    return clock
+
+
+class Call:
+    def __init__(self, result="stored", error=None):
+        self.count = 0
+        self.result = result
+        self.error = error
+
+    async def __call__(self):
+        self.count += 1
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        return f"{self.result}-{self.count}"
+
+
+def test_replay_returns_first_response(clock):
+    store = IdempotencyStore()
+    call = Call()
+
+    async def main():
+        first = await store.run("key", "body", call)
+        return first, await store.run("key", "body", call)
+
+    assert asyncio.run(main()) == ("stored-1", "stored-1")
+    assert call.count == 1
+    assert "key" in store
+
+
+def test_concurrent_requests_share_one_call(clock):
+    store = IdempotencyStore()
+    call = Call()
+
+    async def main():
+        return await asyncio.gather(*(store.run("key", "body", call) for _ in range(5)))
+
+    assert asyncio.run(main()) == ["stored-1"] * 5
+    assert call.count == 1
+
+
+def test_same_key_different_body_conflicts(clock):
+    store = IdempotencyStore()
+
+    async def main():
+        await store.run("key", "body", Call())
+        await store.run("key", "other body", Call())
+
+    with pytest.raises(IdempotencyConflict):
+        asyncio.run(main())
+
+
+def test_failures_are_not_cached(clock):
+    store = IdempotencyStore()
+    failing = Call(error=RuntimeError("database down"))
+    call = Call()
+
+    async def main():
+        with pytest.raises(RuntimeError):
+            await store.run("key", "body", failing)
+        assert "key" not in store
+        return await store.run("key", "body", call)
+
+    assert asyncio.run(main()) == "stored-1"
+
+
+def test_entries_expire_after_ttl(clock):
+    store = IdempotencyStore(ttl=60)
+    call = Call()
+
+    async def main():
+        await store.run("key", "body", call)
+        clock.now += 61
+        assert "key" not in store
+        return await store.run("key", "body", call)
+
+    assert asyncio.run(main()) == "stored-2"
+
+
+def test_oldest_entries_are_evicted_beyond_max_entries(clock):
+    store = IdempotencyStore(max_entries=2)
+
+    async def main():
+        for key in ("a", "b", "c", "d"):
+            await store.run(key, "body", Call())
+
+    asyncio.run(main())
+    assert "a" not in store and "b" not in store
+    assert "d" in store
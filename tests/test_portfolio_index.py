@@ -0,0 +1,103 @@
+import orjson
+
+from portfolio_data import portfolio_data
+from portfolio_index import PortfolioIndex, normalize
+
+DATA = {
+    "projects": [
+        {"id": 1, "name": "Sales dashboard", "tools": ["MS Power BI", "DAX", "SQL"]},
+        {"id": 2, "name": "Churn model", "tools": ["Python", "sklearn"]},
+        {"id": 3, "name": "Finance reporting", "tools": ["Power BI", "PowerBI"]},
+    ],
+    "experience": [
+        {
+            "id": 1,
+            "role": "BI Analyst",
+            "company": "Acme",
+            "responsibilities": [
+                "Migration des flux vers SQL Server et SSIS",
+                "Dashboards Microsoft Power BI pour la direction",
+            ],
+        },
+        {
+            "id": 2,
+            "role": "Data Analyst",
+            "company": "Globex",
+            "responsibilities": ["Requêtes SQL et analyses en Python", "Scripts R pour le reporting"],
+        },
+    ],
+    "skills": {
+        "bi": {"title": "Business Intelligence", "items": ["Power BI", "SSIS"]},
+        "databases": {"title": "Bases de données", "items": ["SQL Server"]},
+        "languages": {"title": "Langages", "items": ["SQL", "Python", "R"]},
+    },
+}
+
+
+def _lookup(index, tool):
+    return orjson.loads(index.lookup(tool))
+
+
+def test_normalize_folds_case_accents_and_punctuation():
+    assert normalize("  Entrepôt de DONNÉES ") == "entrepot de donnees"
+    assert normalize("Scikit-Learn") == "scikit learn"
+
+
+def test_aliases_fold_to_the_canonical_name():
+    index = PortfolioIndex(DATA)
+    result = _lookup(index, "MS Power BI")
+
+    assert result["tool"] == "Power BI"
+    assert result == _lookup(index, "power bi") == _lookup(index, "PowerBI")
+    # Both spellings in one project's tools count the project once
+    assert [p["id"] for p in result["projects"]] == [1, 3]
+
+
+def test_longest_match_wins_in_responsibilities():
+    index = PortfolioIndex(DATA)
+
+    sql_server = _lookup(index, "SQL Server")
+    sql = _lookup(index, "SQL")
+
+    # "SQL Server" in Acme's duties is not also counted as a mention of "SQL"
+    assert [role["company"] for role in sql_server["experience"]] == ["Acme"]
+    assert [role["company"] for role in sql["experience"]] == ["Globex"]
+
+
+def test_facet_counts():
+    result = _lookup(PortfolioIndex(DATA), "Power BI")
+
+    assert result["matched"] is True
+    assert result["facets"] == {"projects": 2, "experience": 1, "skills": 1}
+    assert result["skills"] == [{"key": "bi", "title": "Business Intelligence"}]
+    assert result["experience"] == [{"id": 1, "role": "BI Analyst", "company": "Acme"}]
+
+
+def test_unknown_tool_has_zero_counts():
+    result = _lookup(PortfolioIndex(DATA), "Tableau")
+
+    assert result["matched"] is False
+    assert result["tool"] == "Tableau"
+    assert result["facets"] == {"projects": 0, "experience": 0, "skills": 0}
+    assert result["projects"] == result["experience"] == result["skills"] == []
+
+
+def test_known_alias_without_mentions_is_unmatched():
+    result = _lookup(PortfolioIndex(DATA), "Apache Kafka")
+
+    assert result["matched"] is False
+    assert result["tool"] == "Kafka"
+
+
+def test_single_letter_skills_are_not_matched_in_free_text():
+    # "R" is a listed skill, but Globex's "Scripts R" is not counted as a mention
+    result = _lookup(PortfolioIndex(DATA), "R")
+
+    assert result["facets"] == {"projects": 0, "experience": 0, "skills": 1}
+
+
+def test_builds_from_portfolio_data():
+    index = PortfolioIndex(portfolio_data)
+
+    assert "Power BI" in index.tools
+    assert _lookup(index, "MS Power BI")["facets"]["skills"] >= 1
@@ -0,0 +1,60 @@
+import pytest
+
+import rate_limit
+from rate_limit import TokenBucketLimiter
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", clock)
+    return clock
+
+
+def test_burst_then_retry_after(clock):
+    limiter = TokenBucketLimiter(capacity=3, refill_per_second=0.5)
+
+    assert [limiter.acquire("a") for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.acquire("a") == pytest.approx(2.0)
+    clock.now += 0.5
+    assert limiter.acquire("a") == pytest.approx(1.5)
+
+
+def test_refill_is_capped_at_capacity(clock):
+    limiter = TokenBucketLimiter(capacity=2, refill_per_second=1)
+    limiter.acquire("a")
+    limiter.acquire("a")
+
+    clock.now += 1
+    assert limiter.acquire("a") == 0.0
+    assert limiter.acquire("a") > 0
+
+    clock.now += 3600
+    assert [limiter.acquire("a") for _ in range(3)][:2] == [0.0, 0.0]
+    assert limiter.acquire("a") > 0
+
+
+def test_keys_are_independent(clock):
+    limiter = TokenBucketLimiter(capacity=1, refill_per_second=1)
+
+    assert limiter.acquire("a") == 0.0
+    assert limiter.acquire("a") > 0
+    assert limiter.acquire("b") == 0.0
+
+
+def test_least_recently_used_keys_are_dropped(clock):
+    limiter = TokenBucketLimiter(capacity=1, refill_per_second=0.001, max_keys=2)
+    for key in ("a", "b", "c"):
+        limiter.acquire(key)
+
+    # "a" was forgotten and starts again with a full bucket; "c" was not
+    assert limiter.acquire("a") == 0.0
+    assert limiter.acquire("c") > 0
@@ -0,0 +1,110 @@
+import pytest
+
+import response_cache
+from response_cache import CACHE_BYTES, CACHE_EVICTIONS, ResponseCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(response_cache.time, "monotonic", clock)
+    return clock
+
+
+def evictions(reason):
+    return CACHE_EVICTIONS._values.get((reason,), 0)
+
+
+def fill(cache, namespace, key, body=b"body"):
+    cache.put(namespace, key, body, {}, cache.generation(namespace))
+
+
+def test_hit_then_expired(clock):
+    cache = ResponseCache(ttl=5)
+    fill(cache, "status", "a")
+    assert cache.get("status", "a").body == b"body"
+
+    before = evictions("expired")
+    clock.now += 5
+    assert cache.get("status", "a") is None
+    assert evictions("expired") == before + 1
+    assert len(cache) == 0 and cache.size == 0
+
+
+def test_fill_started_before_invalidate_is_not_stored(clock):
+    cache = ResponseCache()
+    generation = cache.generation("contacts")
+
+    cache.invalidate("contacts")
+    cache.put("contacts", "a", b"stale", {}, generation)
+
+    assert cache.get("contacts", "a") is None
+    fill(cache, "contacts", "a", b"fresh")
+    assert cache.get("contacts", "a").body == b"fresh"
+
+
+def test_invalidate_only_drops_its_namespace(clock):
+    cache = ResponseCache()
+    fill(cache, "contacts", "a")
+    fill(cache, "status", "b")
+
+    before = evictions("invalidated")
+    cache.invalidate("contacts")
+
+    assert evictions("invalidated") == before + 1
+    assert cache.get("contacts", "a") is None
+    assert cache.get("status", "b") is not None
+    assert cache.size == 4
+
+
+def test_max_bytes_evicts_least_recently_used(clock):
+    cache = ResponseCache(max_bytes=10)
+    fill(cache, "status", "a", b"1234")
+    fill(cache, "status", "b", b"1234")
+    cache.get("status", "a")
+
+    before = evictions("capacity")
+    fill(cache, "status", "c", b"1234")
+
+    assert evictions("capacity") == before + 1
+    assert cache.get("status", "b") is None
+    assert cache.get("status", "a") is not None
+    assert cache.size == 8
+    assert CACHE_BYTES._values[()] == 8
+
+
+def test_body_larger_than_max_bytes_is_not_stored(clock):
+    cache = ResponseCache(max_bytes=4)
+    fill(cache, "status", "a", b"12345")
+
+    assert len(cache) == 0 and cache.size == 0
+
+
+def test_max_entries_and_replacement_keep_size_consistent(clock):
+    cache = ResponseCache(max_entries=2)
+    fill(cache, "status", "a", b"1")
+    fill(cache, "status", "a", b"123")
+    assert cache.size == 3
+
+    fill(cache, "status", "b", b"12")
+    fill(cache, "status", "c", b"1")
+
+    assert len(cache) == 2
+    assert cache.get("status", "a") is None
+    assert cache.size == 3
+
+
+def test_disabled_cache_stores_nothing(clock):
+    cache = ResponseCache(ttl=0)
+    fill(cache, "status", "a")
+
+    assert not cache.enabled
+    assert cache.get("status", "a") is None
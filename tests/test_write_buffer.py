@@ -0,0 +1,82 @@
+import asyncio
+
+from bson import ObjectId
+from pymongo.errors import AutoReconnect, BulkWriteError, DocumentTooLarge, OperationFailure
+
+from write_buffer import DUPLICATE_KEY, WriteBehindBuffer
+
+
+class FakeCollection:
+    name = "fake"
+
+    def __init__(self, failures=()):
+        self.docs = {}
+        self.failures = list(failures)
+
+    async def insert_many(self, docs, ordered=False):
+        if self.failures:
+            raise self.failures.pop(0)
+        if any(doc.get("oversized") for doc in docs):
+            raise DocumentTooLarge("document too large")
+        errors = []
+        for index, doc in enumerate(docs):
+            if doc.get("invalid"):
+                errors.append({"index": index, "code": 121, "errmsg": "Document failed validation"})
+            elif doc.pop("disk_full_once", False):
+                errors.append({"index": index, "code": 14031, "errmsg": "Out of disk space"})
+            elif doc["_id"] in self.docs:
+                errors.append({"index": index, "code": DUPLICATE_KEY, "errmsg": "duplicate key"})
+            else:
+                self.docs[doc["_id"]] = doc
+        if errors:
+            raise BulkWriteError({"writeErrors": errors})
+
+
+def _doc(**fields):
+    return {"_id": ObjectId(), **fields}
+
+
+def _flush_all(collection, docs, **options):
+    async def main():
+        buffer = WriteBehindBuffer(collection, flush_interval_ms=5, retry_delay=0.001, **options)
+        buffer.start()
+        for doc in docs:
+            await buffer.put(doc)
+        await buffer.stop()
+
+    asyncio.run(main())
+
+
+def test_transient_errors_are_retried():
+    collection = FakeCollection(failures=[AutoReconnect("connection reset")] * 3)
+    docs = [_doc(i=i) for i in range(10)]
+
+    _flush_all(collection, docs)
+
+    assert len(collection.docs) == 10
+
+
+def test_server_side_failures_are_retried_not_dropped():
+    collection = FakeCollection(failures=[OperationFailure("not authorized", code=13)] * 2)
+    docs = [_doc(i=0), _doc(disk_full_once=True), _doc(i=2)]
+
+    _flush_all(collection, docs)
+
+    assert set(collection.docs) == {doc["_id"] for doc in docs}
+
+
+def test_rejected_documents_do_not_stall_the_queue():
+    collection = FakeCollection()
+    docs = [_doc(i=0), _doc(invalid=True), _doc(oversized=True), _doc(i=3)]
+
+    _flush_all(collection, docs)
+
+    assert set(collection.docs) == {docs[0]["_id"], docs[3]["_id"]}
+
+
+def test_stop_gives_up_after_drain_timeout():
+    collection = FakeCollection(failures=[AutoReconnect("unreachable")] * 10000)
+
+    _flush_all(collection, [_doc()], drain_timeout=0.05)
+
+    assert collection.docs == {}